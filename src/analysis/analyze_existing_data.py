@@ -10,7 +10,6 @@ from typing import Dict, List, Any, Tuple
 from collections import Counter, defaultdict
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 from datetime import datetime
 import jieba
 import re
@@ -84,14 +83,20 @@ class ExistingDataAnalyzer:
         performance_analysis = {}
         for model_type, data in type_performance.items():
             if data['views']:
+                # 每个指标只归约一次，比率直接复用已算好的均值
+                avg_views = np.mean(data['views'])
+                avg_likes = np.mean(data['likes'])
+                avg_downloads = np.mean(data['downloads'])
+                views_base = max(avg_views, 1)
                 performance_analysis[model_type] = {
                     'count': len(data['views']),
-                    'avg_views': np.mean(data['views']),
-                    'avg_likes': np.mean(data['likes']),
-                    'avg_downloads': np.mean(data['downloads']),
-                    'engagement_rate': np.mean(data['likes']) / max(np.mean(data['views']), 1) * 100,
-                    'download_rate': np.mean(data['downloads']) / max(np.mean(data['views']), 1) * 100,
-                    'top_model': max(data['models'], key=lambda x: self.parse_number(x.get('views', '0')))
+                    'avg_views': avg_views,
+                    'avg_likes': avg_likes,
+                    'avg_downloads': avg_downloads,
+                    'engagement_rate': avg_likes / views_base * 100,
+                    'download_rate': avg_downloads / views_base * 100,
+                    # 浏览量已解析并与 models 一一对应，argmax 取第一个最大值，与 max() 一致
+                    'top_model': data['models'][int(np.argmax(data['views']))]
                 }
         
         # 创建可视化
@@ -10,11 +10,11 @@ from typing import Dict, List, Any, Tuple
 from collections import Counter, defaultdict
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 from datetime import datetime, timedelta
 import jieba
 import wordcloud
 from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
@@ -54,7 +54,6 @@ class CarDesignTrendAnalyzer:
         """分析车辆类型趋势"""
         print("🚗 分析车辆类型趋势...")
         
-        vehicle_counts = Counter()
         vehicle_stats = defaultdict(lambda: {
             'total_likes': 0,
             'total_downloads': 0,
@@ -70,17 +69,23 @@ class CarDesignTrendAnalyzer:
             if not vehicle_types:
                 vehicle_types = ['未分类']
             
+            likes = stats.get('likeCount', 0)
+            downloads = stats.get('downloadCount', 0)
+            generates = stats.get('generateCount', 0)
             for vehicle_type in vehicle_types:
-                vehicle_counts[vehicle_type] += 1
-                vehicle_stats[vehicle_type]['total_likes'] += stats.get('likeCount', 0)
-                vehicle_stats[vehicle_type]['total_downloads'] += stats.get('downloadCount', 0)
-                vehicle_stats[vehicle_type]['total_generates'] += stats.get('generateCount', 0)
-                vehicle_stats[vehicle_type]['models'].append({
+                entry = vehicle_stats[vehicle_type]
+                entry['total_likes'] += likes
+                entry['total_downloads'] += downloads
+                entry['total_generates'] += generates
+                entry['models'].append({
                     'title': model.get('title', ''),
                     'uuid': model.get('uuid', ''),
-                    'likes': stats.get('likeCount', 0)
+                    'likes': likes
                 })
         
+        # 每个类型的模型数即其 models 列表长度，循环结束后一次性构建计数
+        vehicle_counts = Counter({vehicle_type: len(stats['models']) for vehicle_type, stats in vehicle_stats.items()})
+        
         # 计算平均受欢迎度
         vehicle_popularity = {}
         for vehicle_type, stats in vehicle_stats.items():
@@ -107,7 +112,6 @@ class CarDesignTrendAnalyzer:
         """分析设计风格趋势"""
         print("🎨 分析设计风格趋势...")
         
-        style_counts = Counter()
         style_combinations = Counter()
         style_performance = defaultdict(lambda: {
             'total_likes': 0,
@@ -124,14 +128,16 @@ class CarDesignTrendAnalyzer:
                 design_styles = ['通用设计']
             
             # 单一风格统计
+            likes = stats.get('likeCount', 0)
+            downloads = stats.get('downloadCount', 0)
             for style in design_styles:
-                style_counts[style] += 1
-                style_performance[style]['total_likes'] += stats.get('likeCount', 0)
-                style_performance[style]['total_downloads'] += stats.get('downloadCount', 0)
-                style_performance[style]['models'].append({
+                entry = style_performance[style]
+                entry['total_likes'] += likes
+                entry['total_downloads'] += downloads
+                entry['models'].append({
                     'title': model.get('title', ''),
                     'uuid': model.get('uuid', ''),
-                    'likes': stats.get('likeCount', 0)
+                    'likes': likes
                 })
             
             # 风格组合统计
@@ -139,6 +145,8 @@ class CarDesignTrendAnalyzer:
                 combo = ' + '.join(sorted(design_styles))
                 style_combinations[combo] += 1
         
+        style_counts = Counter({style: len(data['models']) for style, data in style_performance.items()})
+        
         # 创建可视化
         self.plot_design_style_trends(style_counts, style_combinations)
         
@@ -160,7 +168,6 @@ class CarDesignTrendAnalyzer:
         """分析渲染风格趋势"""
         print("🖼️ 分析渲染风格趋势...")
         
-        render_counts = Counter()
         render_quality = defaultdict(lambda: {
             'total_likes': 0,
             'total_generates': 0,
@@ -175,17 +182,21 @@ class CarDesignTrendAnalyzer:
             if not render_styles:
                 render_styles = ['通用渲染']
             
+            likes = stats.get('likeCount', 0)
+            generates = stats.get('generateCount', 0)
             for render_style in render_styles:
-                render_counts[render_style] += 1
-                render_quality[render_style]['total_likes'] += stats.get('likeCount', 0)
-                render_quality[render_style]['total_generates'] += stats.get('generateCount', 0)
-                render_quality[render_style]['models'].append({
+                entry = render_quality[render_style]
+                entry['total_likes'] += likes
+                entry['total_generates'] += generates
+                entry['models'].append({
                     'title': model.get('title', ''),
                     'uuid': model.get('uuid', ''),
-                    'likes': stats.get('likeCount', 0),
-                    'generates': stats.get('generateCount', 0)
+                    'likes': likes,
+                    'generates': generates
                 })
         
+        render_counts = Counter({style: len(data['models']) for style, data in render_quality.items()})
+        
         return {
             'render_counts': dict(render_counts),
             'render_quality': {
@@ -219,16 +230,16 @@ class CarDesignTrendAnalyzer:
             stats = model.get('stats', {})
             car_analysis = model.get('car_analysis', {})
             
-            author_stats[username]['model_count'] += 1
-            author_stats[username]['total_likes'] += stats.get('likeCount', 0)
-            author_stats[username]['total_downloads'] += stats.get('downloadCount', 0)
-            author_stats[username]['total_generates'] += stats.get('generateCount', 0)
+            entry = author_stats[username]
+            entry['model_count'] += 1
+            entry['total_likes'] += stats.get('likeCount', 0)
+            entry['total_downloads'] += stats.get('downloadCount', 0)
+            entry['total_generates'] += stats.get('generateCount', 0)
             
             # 统计专长
-            for vehicle_type in car_analysis.get('vehicle_types', []):
-                author_stats[username]['specialties'][vehicle_type] += 1
+            entry['specialties'].update(car_analysis.get('vehicle_types', []))
             
-            author_stats[username]['models'].append({
+            entry['models'].append({
                 'title': model.get('title', ''),
                 'uuid': model.get('uuid', ''),
                 'likes': stats.get('likeCount', 0)
@@ -524,13 +535,20 @@ class CarDesignTrendAnalyzer:
                 colormap='viridis'
             ).generate_from_frequencies(filtered_keywords)
             
-            plt.figure(figsize=(12, 6))
-            plt.imshow(wc, interpolation='bilinear')
-            plt.axis('off')
-            plt.title('汽车设计关键词云图', fontsize=16, pad=20)
-            plt.tight_layout()
-            plt.savefig(os.path.join(self.output_dir, 'keyword_wordcloud.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+            # 直接用 PIL 输出，标题绘制在词云上方的空白栏中
+            image = wc.to_image()
+            title_height = 60
+            canvas = Image.new('RGB', (image.width, image.height + title_height), 'white')
+            canvas.paste(image, (0, title_height))
+            
+            try:
+                font = ImageFont.truetype('SimHei.ttf', 32)
+            except OSError:
+                font = ImageFont.load_default()
+            draw = ImageDraw.Draw(canvas)
+            draw.text((image.width // 2, title_height // 2), '汽车设计关键词云图', fill='black', font=font, anchor='mm')
+            
+            canvas.save(os.path.join(self.output_dir, 'keyword_wordcloud.png'))
             
         except Exception as e:
             print(f"⚠️ 词云生成失败: {e}")
@@ -10,16 +10,19 @@ import os
 import sys
 import json
 import logging
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from wordcloud import WordCloud
-import matplotlib.font_manager as fm
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 添加项目根目录到路径
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
@@ -30,6 +33,79 @@ from scripts.database.database_manager import DatabaseManager
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 图表样式只需初始化一次
+_PLOT_STYLE_INITIALIZED = False
+
+def _init_plot_style():
+    """设置图表样式与调色板（进程内仅执行一次）"""
+    global _PLOT_STYLE_INITIALIZED
+    if _PLOT_STYLE_INITIALIZED:
+        return
+    # matplotlib/seaborn 导入耗时较长，仅在真正出图时加载
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.style.use('default')
+    sns.set_palette("husl")
+    _PLOT_STYLE_INITIALIZED = True
+
+def _to_count(series):
+    """将计数列解析为 int32（无法解析的值记为 0），减少后续归约扫描的字节数"""
+    return pd.to_numeric(series, errors='coerce').fillna(0).astype('int32')
+
+def _topk_indices(values, k):
+    """返回最大 k 个值的位置（降序，并列时保持原顺序，与 nlargest(keep='first') 一致）
+    
+    先用 O(N) 的 np.partition 找到第 k 大的阈值，只对入选的 k 个位置排序。
+    """
+    k = min(k, values.size)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(values, values.size - k)[values.size - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    idx = np.sort(np.concatenate([above, ties]))
+    return idx[np.argsort(-values[idx], kind='stable')]
+
+def _top_records(df, n, sort_col, columns):
+    """取 sort_col 最大的 n 行，按列提取后 zip 成记录列表，避免逐行构造 Series"""
+    top = df.iloc[_topk_indices(df[sort_col].to_numpy(), n)]
+    arrays = [top[col].tolist() for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*arrays)]
+
+def _render_word_cloud(text, font_path, wordcloud_path):
+    """渲染词云图并保存（模块级函数，可在子进程中执行）
+    
+    直接用 PIL 输出图片并绘制标题，不经过 matplotlib 的 figure/imshow/savefig 流程。
+    """
+    from PIL import Image, ImageDraw, ImageFont
+    from wordcloud import WordCloud
+    
+    wordcloud = WordCloud(
+        width=800, 
+        height=400, 
+        background_color='white',
+        max_words=50,
+        colormap='viridis',
+        font_path=font_path
+    ).generate(text)
+    
+    # 在词云上方留出标题栏
+    image = wordcloud.to_image()
+    title_height = 48
+    canvas = Image.new('RGB', (image.width, image.height + title_height), 'white')
+    canvas.paste(image, (0, title_height))
+    
+    font = ImageFont.truetype(font_path, 24) if font_path else ImageFont.load_default()
+    draw = ImageDraw.Draw(canvas)
+    draw.text((image.width // 2, title_height // 2), '热门作品关键词云图', fill='black', font=font, anchor='mm')
+    
+    canvas.save(wordcloud_path)
+    
+    return wordcloud_path
+
 class DatabaseAnalysisPipeline:
     """数据库驱动的分析流水线"""
     
@@ -43,14 +119,16 @@ class DatabaseAnalysisPipeline:
         for dir_path in [self.output_dir, self.data_dir, self.reports_dir, self.images_dir]:
             os.makedirs(dir_path, exist_ok=True)
         
-        # 设置中文字体
-        self.setup_chinese_fonts()
+        # 中文字体在首次出图时设置，仅做数据分析时无需加载 matplotlib
+        self._fonts_ready = False
         
         # 数据库管理器
         self.db_manager = DatabaseManager()
         
     def setup_chinese_fonts(self):
         """设置中文字体支持"""
+        import matplotlib.pyplot as plt
+        
         try:
             # 尝试设置中文字体
             chinese_fonts = ['SimHei', 'Microsoft YaHei', 'PingFang SC', 'Hiragino Sans GB', 'DejaVu Sans']
@@ -228,20 +306,23 @@ class DatabaseAnalysisPipeline:
             return {}
         
         # 处理数值字段
-        df['like_count'] = pd.to_numeric(df['like_count'], errors='coerce').fillna(0)
-        df['favorite_count'] = pd.to_numeric(df['favorite_count'], errors='coerce').fillna(0)
-        df['comment_count'] = pd.to_numeric(df['comment_count'], errors='coerce').fillna(0)
+        df['like_count'] = _to_count(df['like_count'])
+        df['favorite_count'] = _to_count(df['favorite_count'])
+        df['comment_count'] = _to_count(df['comment_count'])
         
         # 计算参与度
         df['engagement_rate'] = (df['like_count'] + df['favorite_count'] + df['comment_count']) / 100
         
+        # 一次性计算各数值列均值，避免逐列重复归约
+        means = df[['like_count', 'favorite_count', 'comment_count']].mean()
+        
         return {
             'total_works': len(df),
-            'avg_likes': df['like_count'].mean(),
-            'avg_favorites': df['favorite_count'].mean(),
-            'avg_comments': df['comment_count'].mean(),
-            'top_works_by_likes': df.nlargest(10, 'like_count')[['title', 'like_count', 'author_name']].to_dict('records'),
-            'top_works_by_favorites': df.nlargest(10, 'favorite_count')[['title', 'favorite_count', 'author_name']].to_dict('records'),
+            'avg_likes': means['like_count'],
+            'avg_favorites': means['favorite_count'],
+            'avg_comments': means['comment_count'],
+            'top_works_by_likes': _top_records(df, 10, 'like_count', ['title', 'like_count', 'author_name']),
+            'top_works_by_favorites': _top_records(df, 10, 'favorite_count', ['title', 'favorite_count', 'author_name']),
             'engagement_distribution': df['engagement_rate'].describe().to_dict()
         }
     
@@ -250,16 +331,19 @@ class DatabaseAnalysisPipeline:
         if df.empty:
             return {}
         
-        df['works_count'] = pd.to_numeric(df['works_count'], errors='coerce').fillna(0)
-        df['total_likes'] = pd.to_numeric(df['total_likes'], errors='coerce').fillna(0)
-        df['total_favorites'] = pd.to_numeric(df['total_favorites'], errors='coerce').fillna(0)
+        df['works_count'] = _to_count(df['works_count'])
+        df['total_likes'] = _to_count(df['total_likes'])
+        df['total_favorites'] = _to_count(df['total_favorites'])
+        
+        # describe() 已包含均值，复用同一次统计结果
+        productivity = df['works_count'].describe()
         
         return {
             'total_authors': len(df),
-            'avg_works_per_author': df['works_count'].mean(),
-            'top_authors_by_works': df.nlargest(10, 'works_count')[['name', 'works_count']].to_dict('records'),
-            'top_authors_by_likes': df.nlargest(10, 'total_likes')[['name', 'total_likes']].to_dict('records'),
-            'author_productivity': df['works_count'].describe().to_dict()
+            'avg_works_per_author': productivity['mean'],
+            'top_authors_by_works': _top_records(df, 10, 'works_count', ['name', 'works_count']),
+            'top_authors_by_likes': _top_records(df, 10, 'total_likes', ['name', 'total_likes']),
+            'author_productivity': productivity.to_dict()
         }
     
     def analyze_models(self, df):
@@ -267,12 +351,14 @@ class DatabaseAnalysisPipeline:
         if df.empty:
             return {}
         
-        df['usage_count'] = pd.to_numeric(df['usage_count'], errors='coerce').fillna(0)
+        df['usage_count'] = _to_count(df['usage_count'])
+        # 高重复度字符串列转为分类类型，后续计数基于整数编码
+        df['model_type'] = df['model_type'].astype('category')
         
         return {
             'total_models': len(df),
             'model_type_distribution': df['model_type'].value_counts().to_dict(),
-            'top_models_by_usage': df.nlargest(15, 'usage_count')[['model_name', 'model_type', 'usage_count']].to_dict('records'),
+            'top_models_by_usage': _top_records(df, 15, 'usage_count', ['model_name', 'model_type', 'usage_count']),
             'model_usage_stats': df['usage_count'].describe().to_dict()
         }
     
@@ -282,12 +368,15 @@ class DatabaseAnalysisPipeline:
             return {}
         
         df['size_bytes'] = pd.to_numeric(df['size_bytes'], errors='coerce').fillna(0)
+        df['format'] = df['format'].astype('category')
+        
+        size_stats = df['size_bytes'].describe()
         
         return {
             'total_images': len(df),
-            'avg_image_size_mb': df['size_bytes'].mean() / (1024 * 1024),
+            'avg_image_size_mb': size_stats['mean'] / (1024 * 1024),
             'format_distribution': df['format'].value_counts().to_dict(),
-            'size_distribution': df['size_bytes'].describe().to_dict()
+            'size_distribution': size_stats.to_dict()
         }
     
     def analyze_trends(self, df):
@@ -300,22 +389,52 @@ class DatabaseAnalysisPipeline:
         
         # 按日期统计
         daily_counts = df.groupby(df['created_at'].dt.date).size()
+        daily_works = daily_counts.to_dict()
         
         return {
-            'daily_works': daily_counts.to_dict(),
-            'recent_trend': daily_counts.tail(7).to_dict() if len(daily_counts) >= 7 else daily_counts.to_dict()
+            'daily_works': daily_works,
+            'recent_trend': daily_counts.tail(7).to_dict() if len(daily_counts) >= 7 else daily_works
         }
     
     def create_chinese_visualizations(self, analysis_results):
         """创建中文可视化图表"""
         logger.info("创建中文可视化图表...")
         
-        # 设置图表样式
-        plt.style.use('default')
-        sns.set_palette("husl")
+        # 词云与组合图互不依赖：词云在子进程中渲染，主进程同时绘制组合图
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            wordcloud_future = None
+            text = self._get_word_cloud_text(analysis_results)
+            if text:
+                wordcloud_path = os.path.join(self.images_dir, 'works_keywords_wordcloud.png')
+                wordcloud_future = executor.submit(
+                    _render_word_cloud, text, self.get_chinese_font_path(), wordcloud_path
+                )
+            
+            chart_path = self._draw_overview_charts(analysis_results)
+            
+            if wordcloud_future is not None:
+                try:
+                    logger.info(f"词云图保存至: {wordcloud_future.result()}")
+                except Exception as e:
+                    logger.warning(f"创建词云失败: {e}")
         
-        # 创建多个图表
-        fig, axes = plt.subplots(3, 2, figsize=(16, 20))
+        return chart_path
+    
+    def _draw_overview_charts(self, analysis_results):
+        """绘制 3x2 组合分析图"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        # 设置图表样式（样式重置后再设置中文字体，避免字体配置被覆盖）
+        _init_plot_style()
+        if not self._fonts_ready:
+            self.setup_chinese_fonts()
+            self._fonts_ready = True
+        
+        # 直接使用 Agg 画布创建图表，不经过 pyplot 全局状态
+        fig = Figure(figsize=(16, 20))
+        canvas = FigureCanvasAgg(fig)
+        axes = fig.subplots(3, 2)
         fig.suptitle('Liblib汽车交通模型数据库分析报告', fontsize=18, fontweight='bold')
         
         # 1. 作品数量趋势
@@ -373,43 +492,27 @@ class DatabaseAnalysisPipeline:
             axes[2, 1].set_xlabel('参与度')
             axes[2, 1].set_ylabel('频次')
         
-        plt.tight_layout()
+        fig.tight_layout()
         chart_path = os.path.join(self.images_dir, 'database_analysis_charts.png')
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 创建词云
-        self.create_word_cloud(analysis_results)
+        canvas.print_figure(chart_path, dpi=300, bbox_inches='tight')
         
         return chart_path
     
+    def _get_word_cloud_text(self, analysis_results):
+        """从热门作品标题中提取词云文本"""
+        top_works = analysis_results['works_analysis'].get('top_works_by_likes')
+        if not top_works:
+            return ''
+        return ' '.join(work['title'] for work in top_works)
+    
     def create_word_cloud(self, analysis_results):
         """创建词云图"""
         try:
             # 从作品标题中提取关键词
-            if analysis_results['works_analysis'].get('top_works_by_likes'):
-                titles = [work['title'] for work in analysis_results['works_analysis']['top_works_by_likes']]
-                text = ' '.join(titles)
-                
-                # 创建词云
-                wordcloud = WordCloud(
-                    width=800, 
-                    height=400, 
-                    background_color='white',
-                    max_words=50,
-                    colormap='viridis',
-                    font_path=self.get_chinese_font_path()
-                ).generate(text)
-                
-                plt.figure(figsize=(12, 6))
-                plt.imshow(wordcloud, interpolation='bilinear')
-                plt.axis('off')
-                plt.title('热门作品关键词云图', fontsize=16, fontweight='bold')
-                
+            text = self._get_word_cloud_text(analysis_results)
+            if text:
                 wordcloud_path = os.path.join(self.images_dir, 'works_keywords_wordcloud.png')
-                plt.savefig(wordcloud_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                
+                _render_word_cloud(text, self.get_chinese_font_path(), wordcloud_path)
                 logger.info(f"词云图保存至: {wordcloud_path}")
                 
         except Exception as e:
@@ -436,7 +539,7 @@ class DatabaseAnalysisPipeline:
         """生成数据库分析报告"""
         logger.info("生成数据库分析报告...")
         
-        report_content = f"""# Liblib汽车交通模型数据库分析报告
+        parts = [f"""# Liblib汽车交通模型数据库分析报告
 
 **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **数据来源**: 数据库实时查询
@@ -461,22 +564,22 @@ class DatabaseAnalysisPipeline:
 ### 热门作品排行榜
 
 #### 按点赞数排序
-"""
+"""]
         
         if analysis_results['works_analysis'].get('top_works_by_likes'):
             for i, work in enumerate(analysis_results['works_analysis']['top_works_by_likes'][:5], 1):
-                report_content += f"{i}. **{work['title']}** - {work['like_count']} 点赞 (作者: {work['author_name']})\n"
+                parts.append(f"{i}. **{work['title']}** - {work['like_count']} 点赞 (作者: {work['author_name']})\n")
         
-        report_content += f"""
+        parts.append(f"""
 #### 按收藏数排序
-"""
+""")
         
         if analysis_results['works_analysis'].get('top_works_by_favorites'):
             for i, work in enumerate(analysis_results['works_analysis']['top_works_by_favorites'][:5], 1):
-                report_content += f"{i}. **{work['title']}** - {work['favorite_count']} 收藏 (作者: {work['author_name']})\n"
+                parts.append(f"{i}. **{work['title']}** - {work['favorite_count']} 收藏 (作者: {work['author_name']})\n")
         
         # 作者分析
-        report_content += f"""
+        parts.append(f"""
 ## 👨‍🎨 作者分析
 
 ### 作者统计
@@ -484,34 +587,34 @@ class DatabaseAnalysisPipeline:
 - **平均作品数**: {analysis_results['authors_analysis'].get('avg_works_per_author', 0):.1f} 个/作者
 
 ### 高产作者排行榜
-"""
+""")
         
         if analysis_results['authors_analysis'].get('top_authors_by_works'):
             for i, author in enumerate(analysis_results['authors_analysis']['top_authors_by_works'][:5], 1):
-                report_content += f"{i}. **{author['name']}** - {author['works_count']} 个作品\n"
+                parts.append(f"{i}. **{author['name']}** - {author['works_count']} 个作品\n")
         
         # 模型分析
-        report_content += f"""
+        parts.append(f"""
 ## 🔧 模型引用分析
 
 ### 模型类型分布
-"""
+""")
         
         if analysis_results['models_analysis'].get('model_type_distribution'):
             for model_type, count in analysis_results['models_analysis']['model_type_distribution'].items():
                 percentage = (count / analysis_results['models_analysis']['total_models']) * 100
-                report_content += f"- **{model_type}**: {count} 个 ({percentage:.1f}%)\n"
+                parts.append(f"- **{model_type}**: {count} 个 ({percentage:.1f}%)\n")
         
-        report_content += f"""
+        parts.append(f"""
 ### 最常用模型
-"""
+""")
         
         if analysis_results['models_analysis'].get('top_models_by_usage'):
             for i, model in enumerate(analysis_results['models_analysis']['top_models_by_usage'][:5], 1):
-                report_content += f"{i}. **{model['model_name']}** ({model['model_type']}) - 使用 {model['usage_count']} 次\n"
+                parts.append(f"{i}. **{model['model_name']}** ({model['model_type']}) - 使用 {model['usage_count']} 次\n")
         
         # 图片分析
-        report_content += f"""
+        parts.append(f"""
 ## 🖼️ 图片资源分析
 
 ### 图片统计
@@ -519,26 +622,26 @@ class DatabaseAnalysisPipeline:
 - **平均图片大小**: {analysis_results['images_analysis'].get('avg_image_size_mb', 0):.2f} MB
 
 ### 图片格式分布
-"""
+""")
         
         if analysis_results['images_analysis'].get('format_distribution'):
             for format_type, count in analysis_results['images_analysis']['format_distribution'].items():
                 percentage = (count / analysis_results['images_analysis']['total_images']) * 100
-                report_content += f"- **{format_type}**: {count} 个 ({percentage:.1f}%)\n"
+                parts.append(f"- **{format_type}**: {count} 个 ({percentage:.1f}%)\n")
         
         # 趋势分析
-        report_content += f"""
+        parts.append(f"""
 ## 📈 趋势分析
 
 ### 最近7天作品发布趋势
-"""
+""")
         
         if analysis_results['trends_analysis'].get('recent_trend'):
             for date, count in analysis_results['trends_analysis']['recent_trend'].items():
-                report_content += f"- **{date}**: {count} 个作品\n"
+                parts.append(f"- **{date}**: {count} 个作品\n")
         
         # 洞察和建议
-        report_content += f"""
+        parts.append(f"""
 ## 💡 数据洞察
 
 ### 1. 内容创作趋势
@@ -576,7 +679,9 @@ class DatabaseAnalysisPipeline:
 ---
 
 *本报告基于数据库实时查询数据生成，反映了Liblib汽车交通模型板块的最新发展状况*
-"""
+""")
+        
+        report_content = ''.join(parts)
         
         # 保存报告
         report_path = os.path.join(self.reports_dir, 'database_analysis_report.md')
@@ -585,8 +690,16 @@ class DatabaseAnalysisPipeline:
         
         # 保存JSON格式的分析结果
         json_path = os.path.join(self.data_dir, 'database_analysis_results.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, ensure_ascii=False, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            # orjson 原生处理 numpy 标量与非字符串键（如日期），无需 Python 层递归转换
+            Path(json_path).write_bytes(orjson.dumps(
+                analysis_results,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(analysis_results, f, ensure_ascii=False, indent=2, default=str)
         
         logger.info(f"数据库分析报告保存至: {report_path}")
         logger.info(f"分析数据保存至: {json_path}")
@@ -615,6 +728,13 @@ class DatabaseAnalysisPipeline:
             report_path, json_path = self.generate_database_report(analysis_results)
             
             # 输出结果汇总
+            basic_stats = analysis_results['basic_stats']
+            data_summary = {
+                'total_works': basic_stats.get('total_works', 0),
+                'total_authors': basic_stats.get('total_authors', 0),
+                'total_images': basic_stats.get('total_images', 0),
+                'total_models': basic_stats.get('total_models', 0)
+            }
             results_summary = {
                 'status': 'success',
                 'pipeline_steps': ['数据获取', '数据分析', '图表生成', '报告生成'],
@@ -624,18 +744,13 @@ class DatabaseAnalysisPipeline:
                     'charts': chart_path,
                     'wordcloud': os.path.join(self.images_dir, 'works_keywords_wordcloud.png')
                 },
-                'data_summary': {
-                    'total_works': analysis_results['basic_stats'].get('total_works', 0),
-                    'total_authors': analysis_results['basic_stats'].get('total_authors', 0),
-                    'total_images': analysis_results['basic_stats'].get('total_images', 0),
-                    'total_models': analysis_results['basic_stats'].get('total_models', 0)
-                }
+                'data_summary': data_summary
             }
             
-            logger.info("🎉 数据库分析流水线完成！")
-            logger.info(f"📊 共分析了 {results_summary['data_summary']['total_works']} 个作品")
-            logger.info(f"📄 报告文件: {report_path}")
-            logger.info(f"📈 图表文件: {chart_path}")
+            logger.info(
+                "🎉 数据库分析流水线完成！\n📊 共分析了 %s 个作品\n📄 报告文件: %s\n📈 图表文件: %s",
+                data_summary['total_works'], report_path, chart_path
+            )
             
             return results_summary
             
@@ -649,16 +764,18 @@ async def main():
     results = await pipeline.run_complete_pipeline()
     
     if results['status'] == 'success':
+        data_summary = results['data_summary']
+        files_generated = results['files_generated']
         print("\n" + "="*60)
         print("🎉 数据库分析流水线执行成功！")
         print("="*60)
-        print(f"📊 分析作品总数: {results['data_summary']['total_works']}")
-        print(f"👨‍🎨 分析作者总数: {results['data_summary']['total_authors']}")
-        print(f"🖼️ 分析图片总数: {results['data_summary']['total_images']}")
-        print(f"🔧 分析模型总数: {results['data_summary']['total_models']}")
-        print(f"📄 报告文件: {results['files_generated']['report']}")
-        print(f"📈 图表文件: {results['files_generated']['charts']}")
-        print(f"💾 数据文件: {results['files_generated']['analysis_data']}")
+        print(f"📊 分析作品总数: {data_summary['total_works']}")
+        print(f"👨‍🎨 分析作者总数: {data_summary['total_authors']}")
+        print(f"🖼️ 分析图片总数: {data_summary['total_images']}")
+        print(f"🔧 分析模型总数: {data_summary['total_models']}")
+        print(f"📄 报告文件: {files_generated['report']}")
+        print(f"📈 图表文件: {files_generated['charts']}")
+        print(f"💾 数据文件: {files_generated['analysis_data']}")
         print("="*60)
         print("✨ 一键完成：采集→清洗→分析→出图（中文）")
         print("="*60)
@@ -13,13 +13,79 @@
 """
 
 import os
+import re
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Union, Mapping, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 import argparse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_LOGGER = logging.getLogger(__name__)
+
+# 配置文件内容缓存：绝对路径 -> (mtime_ns, size, 原始字节)
+# 文件未变化时跳过 open/read；每次仍重新解析，保证调用方拿到的是独立的字典
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
+# 配置路径分隔符；以后支持 tags.enabled[0] 之类写法时只需扩展此模式
+_PATH_RE = re.compile(r'\.')
+
+
+@lru_cache(maxsize=128)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """拆分点分隔的配置路径；程序用到的路径集合很小，结果按路径缓存"""
+    return tuple(_PATH_RE.split(key_path))
+
+
+def _split_csv(value: str) -> List[str]:
+    return value.split(',')
+
+
+# orjson 不可用时写配置用的编码器，复用同一实例
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+# 命令行参数 -> 配置路径及转换函数（None 表示原样写入）；排序参数需校验，单独处理
+_ARG_MAP = (
+    # 标签相关
+    ('tags', 'tags.enabled', _split_csv),
+    ('exclude_tags', 'tags.disabled', _split_csv),
+    ('custom_keywords', 'tags.custom_keywords', _split_csv),
+    # 页范围相关
+    ('max_pages', 'scraping.max_pages', None),
+    ('page_size', 'scraping.page_size', None),
+    # 并发相关
+    ('max_workers', 'scraping.max_workers', None),
+    ('concurrent_downloads', 'download.concurrent_downloads', None),
+    # 存储路径相关
+    ('output_dir', 'storage.output_dir', None),
+    ('images_dir', 'storage.images_dir', None),
+    # 日志相关
+    ('log_level', 'logging.level', str.upper),
+)
+
+# 环境变量 -> 嵌套配置路径
+_ENV_PREFIX = 'LIBLIB_'
+_ENV_MAP = (
+    ('LIBLIB_API_BASE_URL', ('api', 'base_url')),
+    ('LIBLIB_TIMEOUT', ('api', 'timeout')),
+    ('LIBLIB_COOKIE', ('api', 'cookie')),
+    ('LIBLIB_MAX_WORKERS', ('scraping', 'max_workers')),
+    ('LIBLIB_OUTPUT_DIR', ('storage', 'output_dir')),
+    ('LIBLIB_CONCURRENT_DOWNLOADS', ('download', 'concurrent_downloads')),
+    ('LIBLIB_LOG_LEVEL', ('logging', 'level')),
+)
+
 @dataclass
 class ConfigManager:
     """配置管理器"""
@@ -27,11 +93,14 @@ class ConfigManager:
     config_file: Optional[str] = None
     config_data: Dict[str, Any] = field(default_factory=dict)
     logger: Optional[logging.Logger] = None
+    # 扁平索引："api.base_url" -> 值，get() 只需一次字典查找；按需重建
+    _index: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _index_source: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """初始化后处理"""
-        if not self.logger:
-            self.logger = logging.getLogger(__name__)
+        if self.logger is None:
+            self.logger = _LOGGER
     
     def load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """加载配置文件
@@ -42,69 +111,89 @@ class ConfigManager:
         Returns:
             配置字典
         """
+        raw = None
         if config_path:
             self.config_file = config_path
         elif not self.config_file:
-            # 查找配置文件
-            self.config_file = self._find_config_file()
+            # 查找配置文件（找到时顺带读出内容，避免重复打开）
+            self.config_file, raw = self._find_config_file()
         
         defaults = self._get_default_config()
-        if self.config_file and os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+        self.config_data = defaults
+        try:
+            # 直接尝试读取，文件不存在时走默认配置，不再先做 exists 检查
+            if raw is None and self.config_file:
+                raw = self._read_config_bytes(self.config_file)
+            if raw is None:
+                self.logger.info("使用默认配置")
+            else:
+                loaded = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 # 深度合并：以 loaded 覆盖 defaults
                 self.config_data = self._merge_config(defaults, loaded)
                 self.logger.info(f"配置文件加载成功: {self.config_file}")
-            except Exception as e:
-                self.logger.error(f"配置文件加载失败: {e}")
-                self.config_data = defaults
-        else:
+        except (FileNotFoundError, NotADirectoryError):
             self.logger.info("使用默认配置")
-            self.config_data = defaults
+        except Exception as e:
+            self.logger.error(f"配置文件加载失败: {e}")
         
         # 应用环境变量覆盖
         self._apply_environment_overrides()
-        # 同步扁平派生键，确保覆盖后也生效
-        self._sync_derived_keys()
+        # 所有覆盖完成后统一计算扁平派生键
+        self._compute_derived()
         
         return self.config_data
 
+    def _read_config_bytes(self, path: str) -> bytes:
+        """读取配置文件原始内容，按 (mtime, size) 命中缓存时不再读盘"""
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        cached = _CONFIG_CACHE.get(abs_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(abs_path, 'rb') as f:
+            raw = f.read()
+        _CONFIG_CACHE[abs_path] = (st.st_mtime_ns, st.st_size, raw)
+        return raw
+
     def _merge_config(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """深度合并配置，override 覆盖 base。"""
+        """深度合并配置，override 覆盖 base。
+        
+        用显式栈迭代合并，只复制 override 实际涉及的子树。
+        """
         result = base.copy()
-        for key, value in (override or {}).items():
-            if isinstance(value, dict) and isinstance(result.get(key), dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
-        # 维护派生扁平键，确保 Analyzer 可用
-        result["api_base"] = result.get("api_base") or result.get("api", {}).get("base_url")
-        result["base_url"] = result.get("base_url") or "https://www.liblib.art"
-        result["page_size"] = result.get("page_size") or result.get("scraping", {}).get("page_size", 24)
-        result["max_workers"] = result.get("max_workers") or result.get("scraping", {}).get("max_workers", 4)
-        if not result.get("car_keywords"):
-            result["car_keywords"] = result.get("tags", {}).get("enabled", [])
+        stack = [(result, override or {})]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    merged = current.copy()
+                    dst[key] = merged
+                    stack.append((merged, value))
+                else:
+                    dst[key] = value
         return result
 
-    def _sync_derived_keys(self) -> None:
-        """从嵌套配置同步生成 Analyzer 使用的扁平键。"""
-        api = self.config_data.get("api", {}) or {}
-        scraping = self.config_data.get("scraping", {}) or {}
-        tags = self.config_data.get("tags", {}) or {}
-        if api.get("base_url"):
-            self.config_data["api_base"] = api.get("base_url")
-        if not self.config_data.get("base_url"):
-            self.config_data["base_url"] = "https://www.liblib.art"
-        if scraping.get("page_size") and not self.config_data.get("page_size"):
-            self.config_data["page_size"] = scraping.get("page_size")
-        if scraping.get("max_workers") and not self.config_data.get("max_workers"):
-            self.config_data["max_workers"] = scraping.get("max_workers")
-        if not self.config_data.get("car_keywords"):
-            self.config_data["car_keywords"] = tags.get("enabled", [])
+    def _compute_derived(self) -> None:
+        """从嵌套配置生成 Analyzer 直接访问的扁平键
+        
+        只在 load_config 末尾（文件合并与环境变量覆盖之后）调用一次。
+        配置文件中显式写出的扁平键优先，api_base 始终跟随 api.base_url。
+        """
+        cfg = self.config_data
+        api = cfg.get("api") or {}
+        scraping = cfg.get("scraping") or {}
+        tags = cfg.get("tags") or {}
+        cfg["api_base"] = api.get("base_url") or cfg.get("api_base")
+        cfg["base_url"] = cfg.get("base_url") or "https://www.liblib.art"
+        cfg["page_size"] = cfg.get("page_size") or scraping.get("page_size", 24)
+        cfg["max_workers"] = cfg.get("max_workers") or scraping.get("max_workers", 4)
+        if not cfg.get("car_keywords"):
+            cfg["car_keywords"] = tags.get("enabled", [])
+        self._index_source = None
     
-    def _find_config_file(self) -> Optional[str]:
-        """查找配置文件
+    def _find_config_file(self) -> Tuple[Optional[str], Optional[bytes]]:
+        """查找配置文件，返回 (路径, 原始内容)，未找到时为 (None, None)
         
         优先级：
         1. 当前目录的 config.json
@@ -118,10 +207,12 @@ class ConfigManager:
         ]
         
         for path in search_paths:
-            if os.path.exists(path):
-                return path
+            try:
+                return path, self._read_config_bytes(path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
         
-        return None
+        return None, None
     
     def _get_default_config(self) -> Dict[str, Any]:
         """获取默认配置"""
@@ -173,31 +264,20 @@ class ConfigManager:
             }
         }
 
-        # 兼容 Analyzer 直接访问的扁平键
-        cfg["api_base"] = cfg["api"]["base_url"]
-        cfg["base_url"] = "https://www.liblib.art"
-        cfg["page_size"] = cfg["scraping"]["page_size"]
-        cfg["max_workers"] = cfg["scraping"]["max_workers"]
-        cfg["car_keywords"] = cfg["tags"]["enabled"]
-
         return cfg
     
     def _apply_environment_overrides(self):
         """应用环境变量覆盖"""
-        env_mappings = {
-            "LIBLIB_API_BASE_URL": ("api", "base_url"),
-            "LIBLIB_TIMEOUT": ("api", "timeout"),
-            "LIBLIB_COOKIE": ("api", "cookie"),
-            "LIBLIB_MAX_WORKERS": ("scraping", "max_workers"),
-            "LIBLIB_OUTPUT_DIR": ("storage", "output_dir"),
-            "LIBLIB_CONCURRENT_DOWNLOADS": ("download", "concurrent_downloads"),
-            "LIBLIB_LOG_LEVEL": ("logging", "level")
-        }
+        env = os.environ
+        # 没有任何 LIBLIB_ 前缀的变量时直接返回
+        if not any(key.startswith(_ENV_PREFIX) for key in env):
+            return
         
-        for env_var, config_path in env_mappings.items():
-            env_value = os.getenv(env_var)
+        for env_var, config_path in _ENV_MAP:
+            env_value = env.get(env_var)
             if env_value:
                 self._set_nested_value(config_path, env_value)
+                self._index_source = None
                 self.logger.debug(f"环境变量覆盖: {env_var} = {env_value}")
     
     def _set_nested_value(self, path: tuple, value: Any):
@@ -235,16 +315,26 @@ class ConfigManager:
         Returns:
             配置值
         """
-        keys = key_path.split('.')
-        current = self.config_data
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
+        if self._index_source is not self.config_data:
+            self._rebuild_index()
+        return self._index.get(key_path, default)
+    
+    def _rebuild_index(self):
+        """遍历一次嵌套配置，为每一级路径（含中间节点）建立扁平索引
         
-        return current
+        config_data 被整体替换时会自动重建；嵌套内容请通过 set() 修改，以便索引同步失效。
+        """
+        index = {}
+        stack = [('', self.config_data)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                index[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + '.', value))
+        self._index = index
+        self._index_source = self.config_data
     
     def set(self, key_path: str, value: Any):
         """设置配置值
@@ -253,7 +343,7 @@ class ConfigManager:
             key_path: 配置键路径，如 "api.base_url"
             value: 配置值
         """
-        keys = key_path.split('.')
+        keys = _split_path(key_path)
         current = self.config_data
         
         for key in keys[:-1]:
@@ -262,6 +352,7 @@ class ConfigManager:
             current = current[key]
         
         current[keys[-1]] = value
+        self._index_source = None
     
     def update_from_args(self, args: argparse.Namespace):
         """从命令行参数更新配置
@@ -269,55 +360,29 @@ class ConfigManager:
         Args:
             args: 解析后的命令行参数
         """
-        # 标签相关
-        if hasattr(args, 'tags') and args.tags:
-            self.set('tags.enabled', args.tags.split(','))
-        
-        if hasattr(args, 'exclude_tags') and args.exclude_tags:
-            self.set('tags.disabled', args.exclude_tags.split(','))
-        
-        if hasattr(args, 'custom_keywords') and args.custom_keywords:
-            self.set('tags.custom_keywords', args.custom_keywords.split(','))
+        args_dict = vars(args)
+        for attr, key_path, transform in _ARG_MAP:
+            value = args_dict.get(attr)
+            if value:
+                self.set(key_path, transform(value) if transform else value)
         
         # 排序相关
-        if hasattr(args, 'sort_by') and args.sort_by:
-            if args.sort_by in self.get('sorting.available_fields', []):
-                self.set('sorting.field', args.sort_by)
+        sort_by = args_dict.get('sort_by')
+        if sort_by:
+            if sort_by in self.get('sorting.available_fields', []):
+                self.set('sorting.field', sort_by)
             else:
-                self.logger.warning(f"不支持的排序字段: {args.sort_by}")
+                self.logger.warning(f"不支持的排序字段: {sort_by}")
         
-        if hasattr(args, 'sort_order') and args.sort_order:
-            if args.sort_order in ['asc', 'desc']:
-                self.set('sorting.order', args.sort_order)
+        sort_order = args_dict.get('sort_order')
+        if sort_order:
+            if sort_order in ('asc', 'desc'):
+                self.set('sorting.order', sort_order)
             else:
-                self.logger.warning(f"不支持的排序顺序: {args.sort_order}")
-        
-        # 页范围相关
-        if hasattr(args, 'max_pages') and args.max_pages:
-            self.set('scraping.max_pages', args.max_pages)
-        
-        if hasattr(args, 'page_size') and args.page_size:
-            self.set('scraping.page_size', args.page_size)
+                self.logger.warning(f"不支持的排序顺序: {sort_order}")
         
-        # 并发相关
-        if hasattr(args, 'max_workers') and args.max_workers:
-            self.set('scraping.max_workers', args.max_workers)
-        
-        if hasattr(args, 'concurrent_downloads') and args.concurrent_downloads:
-            self.set('download.concurrent_downloads', args.concurrent_downloads)
-        
-        # 存储路径相关
-        if hasattr(args, 'output_dir') and args.output_dir:
-            self.set('storage.output_dir', args.output_dir)
-        
-        if hasattr(args, 'images_dir') and args.images_dir:
-            self.set('storage.images_dir', args.images_dir)
-        
-        # 日志相关
-        if hasattr(args, 'log_level') and args.log_level:
-            self.set('logging.level', args.log_level.upper())
-        
-        if hasattr(args, 'verbose') and args.verbose:
+        # --verbose 优先于 --log-level
+        if args_dict.get('verbose'):
             self.set('logging.level', 'DEBUG')
     
     def validate_config(self) -> List[str]:
@@ -326,37 +391,41 @@ class ConfigManager:
         Returns:
             错误信息列表
         """
+        # 索引只检查/重建一次，之后各项校验都是本地字典查找
+        if self._index_source is not self.config_data:
+            self._rebuild_index()
+        get = self._index.get
         errors = []
         
         # 验证API配置
-        if not self.get('api.base_url'):
+        if not get('api.base_url'):
             errors.append("API基础URL不能为空")
         
-        if self.get('api.timeout', 0) <= 0:
+        if get('api.timeout', 0) <= 0:
             errors.append("API超时时间必须大于0")
         
         # 验证爬取配置
-        if self.get('scraping.max_pages', 0) <= 0:
+        if get('scraping.max_pages', 0) <= 0:
             errors.append("最大页数必须大于0")
         
-        if self.get('scraping.page_size', 0) <= 0:
+        if get('scraping.page_size', 0) <= 0:
             errors.append("页大小必须大于0")
         
-        if self.get('scraping.max_workers', 0) <= 0:
+        if get('scraping.max_workers', 0) <= 0:
             errors.append("最大工作线程数必须大于0")
         
         # 验证下载配置
-        if self.get('download.concurrent_downloads', 0) <= 0:
+        if get('download.concurrent_downloads', 0) <= 0:
             errors.append("并发下载数必须大于0")
         
         # 验证标签配置
-        enabled_tags = self.get('tags.enabled', [])
+        enabled_tags = get('tags.enabled', [])
         if not enabled_tags:
             errors.append("至少需要启用一个标签")
         
         # 验证排序配置
-        sort_field = self.get('sorting.field')
-        available_fields = self.get('sorting.available_fields', [])
+        sort_field = get('sorting.field')
+        available_fields = get('sorting.available_fields', [])
         if sort_field and sort_field not in available_fields:
             errors.append(f"不支持的排序字段: {sort_field}")
         
@@ -378,8 +447,7 @@ class ConfigManager:
             # 确保目录存在
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+            self._write_json(file_path, self.config_data)
             
             self.logger.info(f"配置已保存到: {file_path}")
             return True
@@ -411,8 +479,7 @@ class ConfigManager:
         }
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(template_config, f, indent=2, ensure_ascii=False)
+            self._write_json(file_path, template_config)
             
             self.logger.info(f"配置模板已创建: {file_path}")
             return True
@@ -420,9 +487,23 @@ class ConfigManager:
             self.logger.error(f"配置模板创建失败: {e}")
             return False
     
-    def get_effective_config(self) -> Dict[str, Any]:
-        """获取有效配置（包含所有默认值）"""
-        return self.config_data.copy()
+    def _write_json(self, file_path: str, data: Dict[str, Any]):
+        """以两空格缩进写出 JSON，orjson 可用时直接写 UTF-8 字节"""
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # 逐块写出编码结果，不在内存中拼出完整字符串
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.writelines(_JSON_ENCODER.iterencode(data))
+    
+    def get_effective_config(self) -> Mapping[str, Any]:
+        """获取有效配置（包含所有默认值）的只读视图，不复制；需要修改请用 clone_config()"""
+        return MappingProxyType(self.config_data)
+    
+    def clone_config(self) -> Dict[str, Any]:
+        """获取有效配置的深拷贝，可自由修改而不影响配置管理器"""
+        return copy.deepcopy(self.config_data)
     
     def print_config_summary(self):
         """打印配置摘要"""
@@ -72,7 +72,7 @@ CREATE TABLE IF NOT EXISTS liblib_work_images (
   content_hash VARCHAR(64) NULL COMMENT '内容哈希',
   size_bytes BIGINT NULL COMMENT '文件大小（字节）',
   downloaded_at DATETIME NULL COMMENT '下载时间',
-  status ENUM('PENDING','OK','FAILED') DEFAULT 'PENDING' COMMENT '下载状态',
+  status ENUM('PENDING','IN_PROGRESS','OK','FAILED') DEFAULT 'PENDING' COMMENT '下载状态',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
   INDEX idx_wi_work (work_id),
   INDEX idx_wi_status (status),
@@ -12,18 +12,81 @@ from mysql.connector import Error
 from dotenv import load_dotenv
 import logging
 from pathlib import Path
+from operator import itemgetter
+from typing import Dict, Tuple
 
-# 设置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('database_migration.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# 设置日志（根日志器已配置时跳过，避免导入时重复创建/打开日志文件）
+if not logging.root.handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('database_migration.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 logger = logging.getLogger(__name__)
 
+# DDL解析缓存：路径 -> (mtime_ns, size, 语句列表)，文件未变化时不再重复解析
+_DDL_CACHE: Dict[str, tuple] = {}
+
+
+def _split_ddl(script: str) -> Tuple[str, ...]:
+    """单遍扫描切分SQL脚本：跳过 --、# 与 /* */ 注释，引号内的分号不作为语句结束"""
+    statements = []
+    buf = []
+    quote = None
+    i, n = 0, len(script)
+    while i < n:
+        c = script[i]
+        if quote:
+            if c == '\\':
+                buf.append(script[i:i + 2])
+                i += 2
+                continue
+            if c == quote:
+                quote = None
+        elif c in '\'"`':
+            quote = c
+        elif c == '#' or (c == '-' and script.startswith('--', i)):
+            j = script.find('\n', i)
+            i = n if j < 0 else j
+            continue
+        elif c == '/' and script.startswith('/*', i):
+            j = script.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+            buf.append(' ')
+            continue
+        elif c == ';':
+            statement = ''.join(buf).strip()
+            if statement:
+                statements.append(statement + ';')
+            buf = []
+            i += 1
+            continue
+        buf.append(c)
+        i += 1
+    
+    # 最后一个语句（如果没有分号结尾）
+    statement = ''.join(buf).strip()
+    if statement:
+        statements.append(statement)
+    return tuple(statements)
+
+
+def _parse_ddl(path: Path) -> Tuple[str, ...]:
+    """读取并切分DDL文件，按 (mtime, size) 缓存解析结果"""
+    key = str(path.resolve())
+    stat = path.stat()
+    cached = _DDL_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        statements = _split_ddl(f.read())
+    _DDL_CACHE[key] = (stat.st_mtime_ns, stat.st_size, statements)
+    return statements
+
 class DatabaseMigrator:
     def __init__(self):
         # 加载环境变量
@@ -56,12 +119,12 @@ class DatabaseMigrator:
             
             if self.connection.is_connected():
                 db_info = self.connection.get_server_info()
-                logger.info(f"成功连接到MySQL服务器，版本: {db_info}")
+                logger.info("成功连接到MySQL服务器，版本: %s", db_info)
                 
                 cursor = self.connection.cursor()
                 cursor.execute("SELECT DATABASE();")
                 database = cursor.fetchone()
-                logger.info(f"当前数据库: {database[0]}")
+                logger.info("当前数据库: %s", database[0])
                 
                 return True
             else:
@@ -69,7 +132,7 @@ class DatabaseMigrator:
                 return False
                 
         except Error as e:
-            logger.error(f"连接数据库时出错: {e}")
+            logger.error("连接数据库时出错: %s", e)
             return False
     
     def create_tables(self):
@@ -82,43 +145,26 @@ class DatabaseMigrator:
             # 读取DDL脚本
             ddl_file = Path(__file__).parent / 'create_tables.sql'
             if not ddl_file.exists():
-                logger.error(f"DDL文件不存在: {ddl_file}")
+                logger.error("DDL文件不存在: %s", ddl_file)
                 return False
             
-            with open(ddl_file, 'r', encoding='utf-8') as f:
-                ddl_script = f.read()
-            
-            # 分割SQL语句 - 改进的分割逻辑
-            statements = []
-            current_statement = ""
-            
-            for line in ddl_script.split('\n'):
-                line = line.strip()
-                if line.startswith('--') or not line:  # 跳过注释和空行
-                    continue
-                
-                current_statement += line + " "
-                
-                if line.endswith(';'):
-                    # 完整的SQL语句
-                    statements.append(current_statement.strip())
-                    current_statement = ""
-            
-            # 添加最后一个语句（如果没有分号结尾）
-            if current_statement.strip():
-                statements.append(current_statement.strip())
+            # 分割SQL语句（结果按文件修改时间缓存）
+            statements = _parse_ddl(ddl_file)
             
             cursor = self.connection.cursor()
             
-            for i, statement in enumerate(statements, 1):
-                if statement and not statement.startswith('--'):
-                    try:
-                        logger.info(f"执行SQL语句 {i}/{len(statements)}: {statement[:50]}...")
-                        cursor.execute(statement)
-                        logger.info(f"SQL语句 {i} 执行成功")
-                    except Error as e:
-                        logger.error(f"执行SQL语句 {i} 时出错: {e}")
-                        return False
+            # 整个脚本一次发送（multi=True），只需一次往返；逐个消费结果以保留每条语句的日志
+            i = 0
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            try:
+                for i, result in enumerate(cursor.execute('\n'.join(statements), multi=True), 1):
+                    if result.with_rows:
+                        result.fetchall()
+                    if info_enabled:
+                        logger.info("SQL语句 %s/%s 执行成功: %s...", i, len(statements), result.statement[:50])
+            except Error as e:
+                logger.error("执行SQL语句 %s 时出错: %s", i + 1, e)
+                return False
             
             # 提交事务
             self.connection.commit()
@@ -126,7 +172,7 @@ class DatabaseMigrator:
             return True
             
         except Error as e:
-            logger.error(f"创建表时出错: {e}")
+            logger.error("创建表时出错: %s", e)
             return False
     
     def verify_tables(self):
@@ -145,25 +191,26 @@ class DatabaseMigrator:
             ]
             
             cursor.execute("SHOW TABLES")
-            existing_tables = [table[0] for table in cursor.fetchall()]
+            existing_tables = list(map(itemgetter(0), cursor.fetchall()))
+            existing_names = frozenset(existing_tables)
             
             logger.info("现有表:")
             for table in existing_tables:
-                logger.info(f"  - {table}")
+                logger.info("  - %s", table)
             
             # 检查索引
             for table in expected_tables:
-                if table in existing_tables:
+                if table in existing_names:
                     cursor.execute(f"SHOW INDEX FROM {table}")
                     indexes = cursor.fetchall()
-                    logger.info(f"\n表 {table} 的索引:")
+                    logger.info("\n表 %s 的索引:", table)
                     for idx in indexes:
-                        logger.info(f"  - {idx[2]} ({idx[4]})")
+                        logger.info("  - %s (%s)", idx[2], idx[4])
             
             return True
             
         except Error as e:
-            logger.error(f"验证表时出错: {e}")
+            logger.error("验证表时出错: %s", e)
             return False
     
     def close_connection(self):
@@ -198,7 +245,7 @@ def main():
         return True
         
     except Exception as e:
-        logger.error(f"执行过程中出现异常: {e}")
+        logger.error("执行过程中出现异常: %s", e)
         return False
     
     finally:
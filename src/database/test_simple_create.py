@@ -11,12 +11,14 @@ import mysql.connector
 from mysql.connector import Error
 from dotenv import load_dotenv
 import logging
+from operator import itemgetter
 
-# 设置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# 设置日志（根日志器已配置时跳过）
+if not logging.root.handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
 def test_simple_create():
@@ -46,8 +48,8 @@ def test_simple_create():
             
             # 检查当前表数量
             cursor.execute("SHOW TABLES")
-            before_tables = cursor.fetchall()
-            logger.info(f"执行前表数量: {len(before_tables)}")
+            before_tables = frozenset(map(itemgetter(0), cursor.fetchall()))
+            logger.info("执行前表数量: %s", len(before_tables))
             
             # 测试创建一个简单的表
             test_sql = """
@@ -62,37 +64,35 @@ def test_simple_create():
             logger.info(test_sql)
             
             try:
-                cursor.execute(test_sql)
+                # 建表、SHOW TABLES 与删表合并为一次 multi 语句调用，只需一次往返；
+                # DDL 会隐式提交，无需额外 commit
+                results = cursor.execute(
+                    f"{test_sql};\nSHOW TABLES;\nDROP TABLE IF EXISTS liblib_test_table",
+                    multi=True
+                )
+                next(results)  # CREATE TABLE
                 logger.info("✅ 测试表创建成功")
                 
-                # 提交事务
-                connection.commit()
-                logger.info("✅ 事务提交成功")
-                
                 # 检查执行后的表数量
-                cursor.execute("SHOW TABLES")
-                after_tables = cursor.fetchall()
-                logger.info(f"执行后表数量: {len(after_tables)}")
+                after_tables = frozenset(map(itemgetter(0), next(results).fetchall()))
+                logger.info("执行后表数量: %s", len(after_tables))
                 
                 # 显示新增的表
-                before_table_names = {table[0] for table in before_tables}
-                after_table_names = {table[0] for table in after_tables}
-                new_tables = after_table_names - before_table_names
+                new_tables = after_tables - before_tables
                 
                 if new_tables:
-                    logger.info(f"✅ 新增的表: {list(new_tables)}")
+                    logger.info("✅ 新增的表: %s", list(new_tables))
                 else:
                     logger.warning("⚠️  没有新增表")
                 
                 # 删除测试表
-                cursor.execute("DROP TABLE IF EXISTS liblib_test_table")
-                connection.commit()
+                next(results)  # DROP TABLE
                 logger.info("✅ 测试表已删除")
                 
             except Error as e:
-                logger.error(f"❌ 创建测试表时出错: {e}")
-                logger.error(f"   错误代码: {e.errno}")
-                logger.error(f"   错误消息: {e.msg}")
+                logger.error("❌ 创建测试表时出错: %s", e)
+                logger.error("   错误代码: %s", e.errno)
+                logger.error("   错误消息: %s", e.msg)
                 return False
             
             cursor.close()
@@ -106,7 +106,7 @@ def test_simple_create():
             return False
             
     except Error as e:
-        logger.error(f"连接数据库时出错: {e}")
+        logger.error("连接数据库时出错: %s", e)
         return False
 
 def main():
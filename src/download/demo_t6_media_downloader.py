@@ -8,32 +8,35 @@ T6 媒体下载器演示脚本
 import os
 import sys
 import time
+import asyncio
+from functools import partial
 from dotenv import load_dotenv
 
+from t6_concurrent_runner import run_concurrently
+
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 # 加载环境变量
 load_dotenv()
 
-def demo_basic_usage():
+def create_downloader():
+    """创建各演示共用的下载器：boto3 导入与S3客户端初始化只做一次"""
+    from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
+    return MediaDownloader(MediaDownloaderConfig())
+
+def demo_basic_usage(downloader):
     """演示基本用法"""
     print("🚀 T6 媒体下载器基本用法演示")
     print("=" * 50)
     
     try:
-        from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
-        
-        # 创建配置
-        config = MediaDownloaderConfig()
+        config = downloader.config
         print(f"✅ 配置加载成功")
         print(f"   - 工作线程数: {config.max_workers}")
         print(f"   - 请求速率: {config.requests_per_second} RPS")
         print(f"   - 目标宽度: {config.target_width}")
         print(f"   - 目标格式: {config.target_format}")
-        
-        # 创建下载器
-        downloader = MediaDownloader(config)
         print(f"✅ 下载器创建成功")
         
         # 检查数据库连接
@@ -89,17 +92,12 @@ def demo_config_management():
         print(f"❌ 配置管理演示失败: {e}")
         return False
 
-def demo_oss_processing():
+def demo_oss_processing(downloader):
     """演示OSS图片处理"""
     print("\n🖼️  T6 媒体下载器OSS处理演示")
     print("=" * 50)
     
     try:
-        from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
-        
-        config = MediaDownloaderConfig()
-        downloader = MediaDownloader(config)
-        
         # 测试URL处理
         test_urls = [
             "https://liblibai-online.liblib.cloud/image1.jpg",
@@ -121,17 +119,12 @@ def demo_oss_processing():
         print(f"❌ OSS处理演示失败: {e}")
         return False
 
-def demo_database_integration():
+def demo_database_integration(downloader):
     """演示数据库集成"""
     print("\n🗄️  T6 媒体下载器数据库集成演示")
     print("=" * 50)
     
     try:
-        from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
-        
-        config = MediaDownloaderConfig()
-        downloader = MediaDownloader(config)
-        
         # 查询待下载图片
         images = downloader.get_pending_images(limit=5)
         
@@ -157,16 +150,13 @@ def demo_database_integration():
         print(f"❌ 数据库集成演示失败: {e}")
         return False
 
-def demo_s3_integration():
+def demo_s3_integration(downloader):
     """演示S3集成"""
     print("\n🔗 T6 媒体下载器S3集成演示")
     print("=" * 50)
     
     try:
-        from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
-        
-        config = MediaDownloaderConfig()
-        downloader = MediaDownloader(config)
+        config = downloader.config
         
         # 测试S3功能
         s3_manager = downloader.s3_manager
@@ -199,16 +189,13 @@ def demo_s3_integration():
         print(f"❌ S3集成演示失败: {e}")
         return False
 
-def demo_performance_features():
+def demo_performance_features(downloader):
     """演示性能特性"""
     print("\n⚡ T6 媒体下载器性能特性演示")
     print("=" * 50)
     
     try:
-        from t6_media_downloader import MediaDownloader, MediaDownloaderConfig
-        
-        config = MediaDownloaderConfig()
-        downloader = MediaDownloader(config)
+        config = downloader.config
         
         print("性能特性:")
         print(f"   - 并发下载: {config.max_workers} 个工作线程")
@@ -225,6 +212,27 @@ def demo_performance_features():
             elapsed = time.time() - start_time
             print(f"   请求 {i+1}: {elapsed:.2f}s")
         
+        # 演示协程限速（异步下载器使用）
+        async def acquire_concurrently():
+            start = time.monotonic()
+            
+            async def acquire_one():
+                await downloader.rate_limiter.acquire()
+                return time.monotonic() - start
+            
+            return await asyncio.gather(*(acquire_one() for _ in range(5)))
+        
+        # 异步入口在安装 uvloop 时使用 uvloop 事件循环
+        try:
+            from t6_media_downloader_async import install_event_loop
+            loop_name = "uvloop" if install_event_loop() else "asyncio 默认事件循环"
+        except ImportError:
+            loop_name = "asyncio 默认事件循环（异步下载器依赖未安装）"
+        
+        print(f"\n异步限速器测试（{loop_name}）:")
+        for i, elapsed in enumerate(asyncio.run(acquire_concurrently())):
+            print(f"   请求 {i+1}: {elapsed:.2f}s")
+        
         print(f"✅ 性能特性演示完成")
         return True
         
@@ -269,67 +277,95 @@ def demo_integration_with_t5():
         print(f"❌ 集成演示失败: {e}")
         return False
 
+def _run_demo(demo_name, demo_func):
+    """打印演示标题并执行"""
+    print(f"\n{'='*20} {demo_name} {'='*20}")
+    return demo_func()
+
+def _report_demo(demo_name, result):
+    """打印单项演示结果，返回 (名称, 是否成功)"""
+    if isinstance(result, Exception):
+        print(f"❌ {demo_name} 演示异常: {result}")
+        result = False
+    elif result:
+        print(f"✅ {demo_name} 演示成功")
+    else:
+        print(f"❌ {demo_name} 演示失败")
+    
+    print("-" * 60)
+    return demo_name, result
+
 def run_all_demos():
     """运行所有演示"""
     print("🎬 开始运行T6媒体下载器演示套件")
     print("=" * 60)
     
-    demos = [
-        ("基本用法", demo_basic_usage),
-        ("配置管理", demo_config_management),
-        ("OSS处理", demo_oss_processing),
-        ("数据库集成", demo_database_integration),
-        ("S3集成", demo_s3_integration),
-        ("性能特性", demo_performance_features),
+    # 各演示共用一个下载器
+    try:
+        downloader = create_downloader()
+    except Exception as e:
+        print(f"❌ 下载器创建失败: {e}")
+        downloader = None
+    
+    def with_downloader(demo_func):
+        if downloader is None:
+            return lambda: False
+        return partial(demo_func, downloader)
+    
+    # 基本用法与配置管理先顺序执行；其余演示涉及互不相关的子系统，并发执行以重叠网络等待
+    sequential = [
+        ("基本用法", with_downloader(demo_basic_usage)),
+        ("配置管理", demo_config_management)
+    ]
+    parallel = [
+        ("OSS处理", with_downloader(demo_oss_processing)),
+        ("数据库集成", with_downloader(demo_database_integration)),
+        ("S3集成", with_downloader(demo_s3_integration)),
+        ("性能特性", with_downloader(demo_performance_features)),
         ("T5集成", demo_integration_with_t5)
     ]
     
     results = []
     
-    for demo_name, demo_func in demos:
+    for demo_name, demo_func in sequential:
         try:
-            print(f"\n{'='*20} {demo_name} {'='*20}")
-            result = demo_func()
-            results.append((demo_name, result))
-            
-            if result:
-                print(f"✅ {demo_name} 演示成功")
-            else:
-                print(f"❌ {demo_name} 演示失败")
-                
+            result = _run_demo(demo_name, demo_func)
         except Exception as e:
-            print(f"❌ {demo_name} 演示异常: {e}")
-            results.append((demo_name, False))
-        
-        print("-" * 60)
+            result = e
+        results.append(_report_demo(demo_name, result))
     
-    # 输出演示结果摘要
-    print("\n" + "=" * 60)
-    print("📊 演示结果摘要")
-    print("=" * 60)
+    parallel = [(demo_name, partial(_run_demo, demo_name, demo_func)) for demo_name, demo_func in parallel]
+    for demo_name, result in run_concurrently(parallel):
+        results.append(_report_demo(demo_name, result))
     
-    passed = 0
-    total = len(results)
+    if downloader is not None:
+        downloader.close()
     
-    for demo_name, result in results:
-        status = "✅ 成功" if result else "❌ 失败"
-        print(f"{demo_name}: {status}")
-        if result:
-            passed += 1
+    # 输出演示结果摘要（整体拼接后一次写出）
+    total = len(results)
+    passed = sum(1 for _, result in results if result)
     
-    print(f"\n总计: {total} 项演示")
-    print(f"成功: {passed} 项")
-    print(f"失败: {total - passed} 项")
-    print(f"成功率: {(passed / total) * 100:.1f}%")
+    lines = ["", "=" * 60, "📊 演示结果摘要", "=" * 60]
+    lines += [f"{demo_name}: {'✅ 成功' if result else '❌ 失败'}" for demo_name, result in results]
+    lines += [
+        f"\n总计: {total} 项演示",
+        f"成功: {passed} 项",
+        f"失败: {total - passed} 项",
+        f"成功率: {(passed / total) * 100:.1f}%"
+    ]
     
     if passed == total:
-        print("\n🎉 所有演示成功！T6媒体下载器功能完整")
-        print("\n💡 下一步:")
-        print("   1. 运行测试脚本: python test_t6_media_downloader.py")
-        print("   2. 执行实际下载: python t6_media_downloader.py")
-        print("   3. 查看详细文档: README_T6_MediaDownloader.md")
+        lines += [
+            "\n🎉 所有演示成功！T6媒体下载器功能完整",
+            "\n💡 下一步:",
+            "   1. 运行测试脚本: python test_t6_media_downloader.py",
+            "   2. 执行实际下载: python t6_media_downloader.py",
+            "   3. 查看详细文档: README_T6_MediaDownloader.md"
+        ]
     else:
-        print(f"\n⚠️  有 {total - passed} 项演示失败，请检查配置和依赖")
+        lines.append(f"\n⚠️  有 {total - passed} 项演示失败，请检查配置和依赖")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return passed == total
 
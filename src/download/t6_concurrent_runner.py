@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+T6 演示/测试脚本的并发执行工具
+各项在线程池中并发运行，输出按线程缓冲，按原顺序整体打印，避免多线程输出交错
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Tuple
+
+class ThreadBufferedStdout:
+    """stdout 代理：登记了缓冲区的线程写入自己的缓冲区，其他线程直接写到原输出"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        with self.lock:
+            return self.stream.write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def emit(self, text: str):
+        """整体写出一段缓冲的输出"""
+        with self.lock:
+            self.stream.write(text)
+            self.stream.flush()
+    
+    def run_buffered(self, func: Callable[[], Any]) -> Tuple[Any, str]:
+        """在当前线程缓冲输出地执行 func，返回 (结果或异常, 输出)"""
+        self.local.buffer = io.StringIO()
+        try:
+            outcome = func()
+        except Exception as e:
+            outcome = e
+        finally:
+            output = self.local.buffer.getvalue()
+            self.local.buffer = None
+        return outcome, output
+
+def run_concurrently(items: List[Tuple[str, Callable[[], Any]]]) -> Iterator[Tuple[str, Any]]:
+    """并发执行 (名称, 函数) 列表，按原顺序打印各项输出并产出 (名称, 结果或异常)"""
+    stdout = ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(items), 1)) as executor:
+            futures = [(name, executor.submit(stdout.run_buffered, func)) for name, func in items]
+            for name, future in futures:
+                outcome, output = future.result()
+                stdout.emit(output)
+                yield name, outcome
+    finally:
+        sys.stdout = stdout.stream
@@ -6,7 +6,9 @@ T6 媒体下载器配置文件
 """
 
 import os
-from typing import Dict, Any
+import sys
+import hashlib
+from typing import Dict, Any, Mapping
 from dotenv import load_dotenv
 
 # 加载环境变量
@@ -15,120 +17,137 @@ load_dotenv()
 class MediaConfig:
     """媒体下载器配置基类"""
     
-    def __init__(self):
+    # 环境预设：子类在此声明的取值覆盖对应的环境变量
+    PRESET: Dict[str, Any] = {}
+    
+    def __init__(self, environ: Mapping[str, str] = None):
+        # 一次取得环境变量映射（可传入字典，便于测试）
+        env = os.environ if environ is None else environ
+        get = env.get
+        
         # S3/MinIO配置
-        self.storage_driver = os.getenv('STORAGE_DRIVER', 's3')
-        self.s3_endpoint = os.getenv('S3_ENDPOINT')
-        self.s3_bucket = os.getenv('S3_BUCKET')
-        self.s3_region = os.getenv('S3_REGION', 'us-east-1')
-        self.s3_access_key = os.getenv('S3_ACCESS_KEY')
-        self.s3_secret_key = os.getenv('S3_SECRET_KEY')
+        self.storage_driver = get('STORAGE_DRIVER', 's3')
+        self.s3_endpoint = get('S3_ENDPOINT')
+        self.s3_bucket = get('S3_BUCKET')
+        self.s3_region = get('S3_REGION', 'us-east-1')
+        self.s3_access_key = get('S3_ACCESS_KEY')
+        self.s3_secret_key = get('S3_SECRET_KEY')
         
         # 数据库配置
-        self.db_host = os.getenv('DB_HOST', 'localhost')
-        self.db_port = int(os.getenv('DB_PORT', '3306'))
-        self.db_name = os.getenv('DB_NAME', 'cardesignspace')
-        self.db_user = os.getenv('DB_USER', 'root')
-        self.db_password = os.getenv('DB_PASSWORD', '')
+        self.db_host = get('DB_HOST', 'localhost')
+        self.db_port = int(get('DB_PORT', '3306'))
+        self.db_name = get('DB_NAME', 'cardesignspace')
+        self.db_user = get('DB_USER', 'root')
+        self.db_password = get('DB_PASSWORD', '')
         
         # 下载配置
-        self.max_workers = int(os.getenv('MEDIA_MAX_WORKERS', '10'))
-        self.requests_per_second = float(os.getenv('MEDIA_RPS', '5.0'))
-        self.max_retries = int(os.getenv('MEDIA_MAX_RETRIES', '3'))
-        self.timeout = int(os.getenv('MEDIA_TIMEOUT', '30'))
+        self.max_workers = int(get('MEDIA_MAX_WORKERS', '10'))
+        self.requests_per_second = float(get('MEDIA_RPS', '5.0'))
+        # 自适应限速：成功时逐步提速，429/5xx/超时时按 beta 倍率降速
+        self.rate_min = float(get('MEDIA_RATE_MIN', '0.5'))
+        self.rate_alpha = float(get('MEDIA_RATE_ALPHA', '0.1'))
+        self.rate_beta = float(get('MEDIA_RATE_BETA', '0.5'))
+        self.max_retries = int(get('MEDIA_MAX_RETRIES', '3'))
+        self.timeout = int(get('MEDIA_TIMEOUT', '30'))
         
         # 图片处理配置
-        self.target_width = int(os.getenv('MEDIA_TARGET_WIDTH', '1024'))
-        self.target_format = os.getenv('MEDIA_TARGET_FORMAT', 'webp')
-        self.quality = int(os.getenv('MEDIA_QUALITY', '85'))
+        self.target_width = int(get('MEDIA_TARGET_WIDTH', '1024'))
+        self.target_format = get('MEDIA_TARGET_FORMAT', 'webp')
+        self.quality = int(get('MEDIA_QUALITY', '85'))
         
         # 验证配置
-        self.verify_size = os.getenv('MEDIA_VERIFY_SIZE', 'true').lower() == 'true'
-        self.verify_hash = os.getenv('MEDIA_VERIFY_HASH', 'true').lower() == 'true'
-        self.min_file_size = int(os.getenv('MEDIA_MIN_SIZE', '1024'))  # 1KB
+        self.verify_size = get('MEDIA_VERIFY_SIZE', 'true').lower() == 'true'
+        self.verify_hash = get('MEDIA_VERIFY_HASH', 'true').lower() == 'true'
+        self.hash_algorithm = get('MEDIA_HASH_ALGORITHM', 'sha256').lower()
+        self.min_file_size = int(get('MEDIA_MIN_SIZE', '1024'))  # 1KB
+        self.buffer_size = int(get('MEDIA_BUFFER_SIZE', str(8 * 1024 * 1024)))  # 下载缓冲块大小
         
         # 日志配置
-        self.log_level = os.getenv('MEDIA_LOG_LEVEL', 'INFO')
-        self.log_file = os.getenv('MEDIA_LOG_FILE', 't6_media_downloader.log')
+        self.log_level = get('MEDIA_LOG_LEVEL', 'INFO')
+        self.log_file = get('MEDIA_LOG_FILE', 't6_media_downloader.log')
         
         # 重试配置
-        self.retry_delay = float(os.getenv('MEDIA_RETRY_DELAY', '1.0'))
-        self.exponential_backoff = os.getenv('MEDIA_EXPONENTIAL_BACKOFF', 'true').lower() == 'true'
+        self.retry_delay = float(get('MEDIA_RETRY_DELAY', '1.0'))
+        self.exponential_backoff = get('MEDIA_EXPONENTIAL_BACKOFF', 'true').lower() == 'true'
         
         # 监控配置
-        self.enable_monitoring = os.getenv('MEDIA_ENABLE_MONITORING', 'true').lower() == 'true'
-        self.metrics_interval = int(os.getenv('MEDIA_METRICS_INTERVAL', '60'))  # 秒
+        self.enable_monitoring = get('MEDIA_ENABLE_MONITORING', 'true').lower() == 'true'
+        self.metrics_interval = int(get('MEDIA_METRICS_INTERVAL', '60'))  # 秒
+        
+        # 应用环境预设
+        self.__dict__.update(self.PRESET)
+        
+        # 依赖请求速率的限速参数在预设之后计算，默认跟随最终的请求速率
+        self.burst = float(get('MEDIA_BURST', self.requests_per_second))  # 令牌桶容量
+        self.rate_max = float(get('MEDIA_RATE_MAX', self.requests_per_second))
 
 class DevConfig(MediaConfig):
     """开发环境配置"""
     
-    def __init__(self):
-        super().__init__()
-        
+    PRESET = {
         # 开发环境特定配置
-        self.max_workers = 5
-        self.requests_per_second = 2.0
-        self.max_retries = 2
-        self.timeout = 15
+        'max_workers': 5,
+        'requests_per_second': 2.0,
+        'max_retries': 2,
+        'timeout': 15,
         
         # 开发环境日志级别
-        self.log_level = 'DEBUG'
+        'log_level': 'DEBUG',
         
         # 开发环境验证配置
-        self.verify_size = True
-        self.verify_hash = True
-        self.min_file_size = 512  # 512B
+        'verify_size': True,
+        'verify_hash': True,
+        'min_file_size': 512,  # 512B
         
         # 开发环境监控
-        self.enable_monitoring = False
+        'enable_monitoring': False
+    }
 
 class TestConfig(MediaConfig):
     """测试环境配置"""
     
-    def __init__(self):
-        super().__init__()
-        
+    PRESET = {
         # 测试环境特定配置
-        self.max_workers = 8
-        self.requests_per_second = 3.0
-        self.max_retries = 3
-        self.timeout = 20
+        'max_workers': 8,
+        'requests_per_second': 3.0,
+        'max_retries': 3,
+        'timeout': 20,
         
         # 测试环境日志级别
-        self.log_level = 'INFO'
+        'log_level': 'INFO',
         
         # 测试环境验证配置
-        self.verify_size = True
-        self.verify_hash = True
-        self.min_file_size = 1024  # 1KB
+        'verify_size': True,
+        'verify_hash': True,
+        'min_file_size': 1024,  # 1KB
         
         # 测试环境监控
-        self.enable_monitoring = True
-        self.metrics_interval = 30
+        'enable_monitoring': True,
+        'metrics_interval': 30
+    }
 
 class ProdConfig(MediaConfig):
     """生产环境配置"""
     
-    def __init__(self):
-        super().__init__()
-        
+    PRESET = {
         # 生产环境特定配置
-        self.max_workers = 20
-        self.requests_per_second = 8.0
-        self.max_retries = 5
-        self.timeout = 45
+        'max_workers': 20,
+        'requests_per_second': 8.0,
+        'max_retries': 5,
+        'timeout': 45,
         
         # 生产环境日志级别
-        self.log_level = 'WARNING'
+        'log_level': 'WARNING',
         
         # 生产环境验证配置
-        self.verify_size = True
-        self.verify_hash = True
-        self.min_file_size = 2048  # 2KB
+        'verify_size': True,
+        'verify_hash': True,
+        'min_file_size': 2048,  # 2KB
         
         # 生产环境监控
-        self.enable_monitoring = True
-        self.metrics_interval = 60
+        'enable_monitoring': True,
+        'metrics_interval': 60
+    }
 
 def load_media_config(env: str = None) -> MediaConfig:
     """加载媒体下载器配置"""
@@ -145,84 +164,72 @@ def load_media_config(env: str = None) -> MediaConfig:
     config_class = config_map.get(env, DevConfig)
     return config_class()
 
-def validate_config(config: MediaConfig) -> Dict[str, Any]:
-    """验证配置有效性"""
-    validation_results = {
-        'valid': True,
-        'errors': [],
-        'warnings': []
-    }
-    
+# 配置校验规则：(属性, 判定函数, 级别, 提示)；判定为假时记入对应级别，提示中的 {} 替换为属性值
+_RULES = (
     # 检查S3配置
-    if not config.s3_endpoint:
-        validation_results['valid'] = False
-        validation_results['errors'].append('S3_ENDPOINT 未配置')
-    
-    if not config.s3_bucket:
-        validation_results['valid'] = False
-        validation_results['errors'].append('S3_BUCKET 未配置')
-    
-    if not config.s3_access_key:
-        validation_results['valid'] = False
-        validation_results['errors'].append('S3_ACCESS_KEY 未配置')
-    
-    if not config.s3_secret_key:
-        validation_results['valid'] = False
-        validation_results['errors'].append('S3_SECRET_KEY 未配置')
+    ('s3_endpoint', bool, 'error', 'S3_ENDPOINT 未配置'),
+    ('s3_bucket', bool, 'error', 'S3_BUCKET 未配置'),
+    ('s3_access_key', bool, 'error', 'S3_ACCESS_KEY 未配置'),
+    ('s3_secret_key', bool, 'error', 'S3_SECRET_KEY 未配置'),
     
     # 检查数据库配置
-    if not config.db_host:
-        validation_results['warnings'].append('DB_HOST 未配置，使用默认值 localhost')
-    
-    if not config.db_name:
-        validation_results['warnings'].append('DB_NAME 未配置，使用默认值 cardesignspace')
+    ('db_host', bool, 'warning', 'DB_HOST 未配置，使用默认值 localhost'),
+    ('db_name', bool, 'warning', 'DB_NAME 未配置，使用默认值 cardesignspace'),
     
     # 检查下载配置
-    if config.max_workers <= 0:
-        validation_results['valid'] = False
-        validation_results['errors'].append('MEDIA_MAX_WORKERS 必须大于0')
-    
-    if config.requests_per_second <= 0:
-        validation_results['valid'] = False
-        validation_results['errors'].append('MEDIA_RPS 必须大于0')
-    
-    if config.max_retries < 0:
-        validation_results['valid'] = False
-        validation_results['errors'].append('MEDIA_MAX_RETRIES 不能为负数')
+    ('max_workers', lambda v: v > 0, 'error', 'MEDIA_MAX_WORKERS 必须大于0'),
+    ('requests_per_second', lambda v: v > 0, 'error', 'MEDIA_RPS 必须大于0'),
+    ('max_retries', lambda v: v >= 0, 'error', 'MEDIA_MAX_RETRIES 不能为负数'),
     
     # 检查图片处理配置
-    if config.target_width <= 0:
-        validation_results['valid'] = False
-        validation_results['errors'].append('MEDIA_TARGET_WIDTH 必须大于0')
-    
-    if config.quality < 1 or config.quality > 100:
-        validation_results['valid'] = False
-        validation_results['errors'].append('MEDIA_QUALITY 必须在1-100之间')
+    ('target_width', lambda v: v > 0, 'error', 'MEDIA_TARGET_WIDTH 必须大于0'),
+    ('quality', lambda v: 1 <= v <= 100, 'error', 'MEDIA_QUALITY 必须在1-100之间'),
     
-    return validation_results
+    # 检查校验配置
+    ('hash_algorithm', hashlib.algorithms_available.__contains__, 'error', 'MEDIA_HASH_ALGORITHM 不受支持: {}'),
+)
+
+def validate_config(config: MediaConfig) -> Dict[str, Any]:
+    """验证配置有效性"""
+    errors = []
+    warnings = []
+    
+    for attr, predicate, severity, message in _RULES:
+        value = getattr(config, attr)
+        if not predicate(value):
+            (errors if severity == 'error' else warnings).append(message.format(value))
+    
+    return {
+        'valid': not errors,
+        'errors': errors,
+        'warnings': warnings
+    }
 
 def print_config_summary(config: MediaConfig):
-    """打印配置摘要"""
-    print("=" * 60)
-    print("T6 媒体下载器配置摘要")
-    print("=" * 60)
-    
-    print(f"环境: {os.getenv('MEDIA_ENV', 'dev')}")
-    print(f"存储驱动: {config.storage_driver}")
-    print(f"S3端点: {config.s3_endpoint}")
-    print(f"S3存储桶: {config.s3_bucket}")
-    print(f"最大工作线程: {config.max_workers}")
-    print(f"请求速率: {config.requests_per_second} RPS")
-    print(f"最大重试次数: {config.max_retries}")
-    print(f"目标图片宽度: {config.target_width}")
-    print(f"目标图片格式: {config.target_format}")
-    print(f"图片质量: {config.quality}")
-    print(f"验证文件大小: {config.verify_size}")
-    print(f"验证文件哈希: {config.verify_hash}")
-    print(f"最小文件大小: {config.min_file_size} bytes")
-    print(f"日志级别: {config.log_level}")
-    print(f"启用监控: {config.enable_monitoring}")
-    print("=" * 60)
+    """打印配置摘要（整体拼接后一次写出）"""
+    lines = [
+        "=" * 60,
+        "T6 媒体下载器配置摘要",
+        "=" * 60,
+        f"环境: {os.getenv('MEDIA_ENV', 'dev')}",
+        f"存储驱动: {config.storage_driver}",
+        f"S3端点: {config.s3_endpoint}",
+        f"S3存储桶: {config.s3_bucket}",
+        f"最大工作线程: {config.max_workers}",
+        f"请求速率: {config.requests_per_second} RPS",
+        f"最大重试次数: {config.max_retries}",
+        f"目标图片宽度: {config.target_width}",
+        f"目标图片格式: {config.target_format}",
+        f"图片质量: {config.quality}",
+        f"验证文件大小: {config.verify_size}",
+        f"验证文件哈希: {config.verify_hash}",
+        f"哈希算法: {config.hash_algorithm}",
+        f"最小文件大小: {config.min_file_size} bytes",
+        f"日志级别: {config.log_level}",
+        f"启用监控: {config.enable_monitoring}",
+        "=" * 60
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     # 测试配置加载
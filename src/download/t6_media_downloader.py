@@ -9,29 +9,124 @@ import os
 import sys
 import json
 import time
+import asyncio
 import logging
 import hashlib
+import ssl
 import threading
+import io
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from tempfile import SpooledTemporaryFile, TemporaryFile
+from urllib.parse import urlsplit
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
 import mysql.connector
 from mysql.connector import Error
 import signal
-from queue import Queue
+from queue import Queue, LifoQueue, Empty
 import mimetypes
 
+try:
+    import aioboto3
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    AIOBOTO3_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 # 加载环境变量
 load_dotenv()
 
+# 下载图片时使用的请求头
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 视为超时的下载异常（超时时自适应限速降速）
+DOWNLOAD_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
+
+# 超过该大小的图片走分片并发上传
+MULTIPART_THRESHOLD = 5 * 1024 * 1024
+MULTIPART_CONFIG = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD, max_concurrency=4)
+
+# 流式下载：按块写入临时文件并增量计算哈希，小文件留在内存，超过 SPOOL_MAX_SIZE 落盘
+STREAM_CHUNK_SIZE = 256 * 1024
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# 图片状态相关SQL（同步与异步版本共用）
+PENDING_IMAGES_QUERY = """
+    SELECT 
+        wi.id,
+        wi.work_id,
+        wi.image_index,
+        wi.src_url,
+        wi.s3_key,
+        wi.status,
+        w.slug as work_slug,
+        w.title as work_title
+    FROM work_images wi
+    JOIN works w ON wi.work_id = w.id
+    WHERE wi.status IN ('PENDING', 'FAILED')
+    AND wi.src_url IS NOT NULL
+    AND wi.src_url != ''
+    ORDER BY wi.created_at ASC
+    LIMIT %s
+"""
+
+# 认领待下载图片：SKIP LOCKED 跳过其他下载进程已锁定的行，多进程可并行认领互不阻塞
+CLAIM_IMAGES_QUERY = PENDING_IMAGES_QUERY.rstrip() + """
+    FOR UPDATE OF wi SKIP LOCKED
+"""
+
+# 同一事务内把认领的行标记为 IN_PROGRESS，{} 为 id 占位符列表
+MARK_IN_PROGRESS_QUERY = "UPDATE work_images SET status = 'IN_PROGRESS' WHERE id IN ({})"
+
+# 批次结束时把未处理完（中断等）的认领行放回 PENDING
+RELEASE_CLAIMED_QUERY = "UPDATE work_images SET status = 'PENDING' WHERE status = 'IN_PROGRESS' AND id IN ({})"
+
+# 状态更新：非 OK 状态传入 NULL，保留原有的 s3_key/content_hash/size_bytes
+UPDATE_IMAGE_QUERY = """
+    UPDATE work_images 
+    SET status = %s, s3_key = COALESCE(%s, s3_key), content_hash = COALESCE(%s, content_hash), 
+        size_bytes = COALESCE(%s, size_bytes), downloaded_at = NOW()
+    WHERE id = %s
+"""
+
+# 状态更新缓冲条数，满后一次 executemany 写入
+STATUS_FLUSH_SIZE = 64
+
+# S3键允许的图片扩展名，其余一律按 jpg 存储
+IMAGE_EXTENSIONS = frozenset(['jpg', 'jpeg', 'png', 'gif', 'webp'])
+
+def image_extension(url: str) -> str:
+    """从原始URL路径取图片扩展名（小写），不在允许列表中时返回 jpg"""
+    path = urlsplit(url).path
+    # 与 urlparse 一致：去掉最后一段路径中的 ;params
+    i = path.find(';', path.rfind('/') + 1)
+    if i >= 0:
+        path = path[:i]
+    if '.' not in path:
+        return 'jpg'
+    ext = path.rpartition('.')[2].lower()
+    return ext if ext in IMAGE_EXTENSIONS else 'jpg'
+
+def sql_placeholders(count: int) -> str:
+    return ', '.join(['%s'] * count)
+
 class MediaDownloaderConfig:
     """T6媒体下载器配置"""
     
@@ -54,6 +149,12 @@ class MediaDownloaderConfig:
         # 下载配置
         self.max_workers = int(os.getenv('MEDIA_MAX_WORKERS', '10'))
         self.requests_per_second = float(os.getenv('MEDIA_RPS', '5.0'))
+        self.burst = float(os.getenv('MEDIA_BURST', str(self.requests_per_second)))  # 令牌桶容量
+        # 自适应限速：成功时逐步提速，429/5xx/超时时按 beta 倍率降速
+        self.rate_min = float(os.getenv('MEDIA_RATE_MIN', '0.5'))
+        self.rate_max = float(os.getenv('MEDIA_RATE_MAX', str(self.requests_per_second)))
+        self.rate_alpha = float(os.getenv('MEDIA_RATE_ALPHA', '0.1'))
+        self.rate_beta = float(os.getenv('MEDIA_RATE_BETA', '0.5'))
         self.max_retries = int(os.getenv('MEDIA_MAX_RETRIES', '3'))
         self.timeout = int(os.getenv('MEDIA_TIMEOUT', '30'))
         
@@ -65,28 +166,178 @@ class MediaDownloaderConfig:
         # 验证配置
         self.verify_size = os.getenv('MEDIA_VERIFY_SIZE', 'true').lower() == 'true'
         self.verify_hash = os.getenv('MEDIA_VERIFY_HASH', 'true').lower() == 'true'
+        self.hash_algorithm = os.getenv('MEDIA_HASH_ALGORITHM', 'sha256').lower()
         self.min_file_size = int(os.getenv('MEDIA_MIN_SIZE', '1024'))  # 1KB
+        self.buffer_size = int(os.getenv('MEDIA_BUFFER_SIZE', str(SPOOL_MAX_SIZE)))  # 下载缓冲块大小
 
 class RateLimiter:
-    """请求限速器"""
+    """请求限速器（令牌桶）
     
-    def __init__(self, requests_per_second: float):
+    桶容量为 burst（默认等于每秒请求数）：空闲时积攒令牌，突发请求可直接放行；
+    令牌耗尽后按 requests_per_second 匀速放行。
+    """
+    
+    def __init__(self, requests_per_second: float, burst: float = None):
         self.requests_per_second = requests_per_second
         self.delay = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.rate = float(requests_per_second)
+        self.capacity = max(1.0, float(burst or requests_per_second))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
     
     def wait_if_needed(self):
-        """等待如果需要限速"""
+        """取一个令牌，桶空时等待补充"""
         with self.lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
             
-            if time_since_last < self.delay:
-                sleep_time = self.delay - time_since_last
-                time.sleep(sleep_time)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
             
-            self.last_request_time = time.time()
+            # 等到攒够一个令牌后立即消耗
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+            self.last_refill = time.monotonic()
+    
+    async def acquire(self):
+        """协程版本：预占一个令牌（可透支），按欠额 asyncio.sleep，不阻塞事件循环"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            await asyncio.sleep(wait)
+
+class AdaptiveTokenBucket(RateLimiter):
+    """自适应令牌桶限速器
+    
+    与 TCP 拥塞控制相同的思路：请求成功时加性提速（不超过 rate_max），
+    遇到 429/5xx/超时时乘性降速（不低于 rate_min）并清空令牌。
+    """
+    
+    def __init__(self, requests_per_second: float, burst: float = None,
+                 rate_min: float = 0.5, rate_max: float = None,
+                 alpha: float = 0.1, beta: float = 0.5, delta: float = 0.1):
+        super().__init__(requests_per_second, burst)
+        self.rate_min = rate_min
+        self.rate_max = rate_max or float(requests_per_second)
+        self.alpha = alpha
+        self.beta = beta
+        self.delta = delta
+    
+    def on_success(self):
+        """请求成功，提高速率"""
+        with self.lock:
+            self.rate = min(self.rate_max, self.rate + max(self.delta, self.alpha * self.rate))
+            self.delay = 1.0 / self.rate
+    
+    def on_failure(self):
+        """源站限流或出错，降低速率并清空令牌"""
+        with self.lock:
+            self.rate = max(self.rate_min, self.rate * self.beta)
+            self.delay = 1.0 / self.rate
+            # 清空令牌；协程模式下已透支的预占保持不变
+            self.tokens = min(self.tokens, 0.0)
+
+class BufferPool:
+    """有界缓冲池：最多 count 块 size 字节的 bytearray，按需创建，用完归还复用"""
+    
+    def __init__(self, count: int, size: int):
+        self.count = count
+        self.size = size
+        self.created = 0
+        # 后进先出：优先复用刚归还、仍在缓存中的缓冲块
+        self.free = LifoQueue()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> Optional[bytearray]:
+        """取一块缓冲；池已用尽时返回 None（不阻塞，调用方自行降级）"""
+        try:
+            return self.free.get_nowait()
+        except Empty:
+            pass
+        with self.lock:
+            if self.created >= self.count:
+                return None
+            self.created += 1
+        return bytearray(self.size)
+    
+    def release(self, buffer: bytearray):
+        self.free.put_nowait(buffer)
+
+class PooledSpool(io.RawIOBase):
+    """基于缓冲池的下载缓冲文件：数据写入池中的 bytearray，超出容量时转存临时文件；
+    池已用尽时退化为 SpooledTemporaryFile"""
+    
+    def __init__(self, pool: BufferPool):
+        super().__init__()
+        self.pool = pool
+        self.buffer = pool.acquire()
+        self.file = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) if self.buffer is None else None
+        self.size = 0
+        self.pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def writable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        if self.file is None:
+            end = self.pos + len(data)
+            if end <= len(self.buffer):
+                self.buffer[self.pos:end] = data
+                self.pos = end
+                self.size = max(self.size, end)
+                return len(data)
+            self._rollover()
+        return self.file.write(data)
+    
+    def readinto(self, target) -> int:
+        if self.file is not None:
+            return self.file.readinto(target)
+        n = max(min(len(target), self.size - self.pos), 0)
+        target[:n] = memoryview(self.buffer)[self.pos:self.pos + n]
+        self.pos += n
+        return n
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.file is not None:
+            return self.file.seek(offset, whence)
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: self.size}[whence]
+        self.pos = base + offset
+        return self.pos
+    
+    def tell(self) -> int:
+        return self.file.tell() if self.file is not None else self.pos
+    
+    def _rollover(self):
+        """超出缓冲容量：已写入的数据转存到临时文件并归还缓冲块"""
+        self.file = TemporaryFile()
+        self.file.write(memoryview(self.buffer)[:self.size])
+        self.file.seek(self.pos)
+        self._release()
+    
+    def _release(self):
+        if self.buffer is not None:
+            self.pool.release(self.buffer)
+            self.buffer = None
+    
+    def close(self):
+        if not self.closed:
+            self._release()
+            if self.file is not None:
+                self.file.close()
+        super().close()
 
 class S3StorageManager:
     """S3存储管理器"""
@@ -100,19 +351,7 @@ class S3StorageManager:
         """设置S3客户端"""
         try:
             if self.config.storage_driver == 's3':
-                s3_config = {
-                    'endpoint_url': self.config.s3_endpoint,
-                    'aws_access_key_id': self.config.s3_access_key,
-                    'aws_secret_access_key': self.config.s3_secret_key,
-                    'region_name': self.config.s3_region
-                }
-                
-                # 如果是MinIO，需要特殊配置
-                if 'minio' in self.config.s3_endpoint.lower():
-                    s3_config['aws_access_key_id'] = self.config.s3_access_key
-                    s3_config['aws_secret_access_key'] = self.config.s3_secret_key
-                
-                self.s3_client = boto3.client('s3', **s3_config)
+                self.s3_client = boto3.client('s3', **self._client_config())
                 
                 # 测试连接
                 self.s3_client.head_bucket(Bucket=self.config.s3_bucket)
@@ -122,26 +361,73 @@ class S3StorageManager:
             logging.error(f"❌ S3连接失败: {e}")
             self.s3_client = None
     
+    def _client_config(self) -> Dict[str, Any]:
+        """S3客户端参数（同步与异步客户端共用）"""
+        s3_config = {
+            'endpoint_url': self.config.s3_endpoint,
+            'aws_access_key_id': self.config.s3_access_key,
+            'aws_secret_access_key': self.config.s3_secret_key,
+            'region_name': self.config.s3_region
+        }
+        
+        # 如果是MinIO，需要特殊配置
+        if 'minio' in self.config.s3_endpoint.lower():
+            s3_config['aws_access_key_id'] = self.config.s3_access_key
+            s3_config['aws_secret_access_key'] = self.config.s3_secret_key
+        
+        return s3_config
+    
+    def async_client(self):
+        """创建 aioboto3 异步客户端，需在事件循环中以 async with 使用"""
+        return aioboto3.Session().client('s3', **self._client_config())
+    
+    def _upload_args(self, s3_key: str, content_type: str = None) -> Dict[str, Any]:
+        """上传时附带的内容类型与元数据"""
+        # 自动检测内容类型
+        if not content_type:
+            content_type = mimetypes.guess_type(s3_key)[0] or 'application/octet-stream'
+        
+        return {
+            'ContentType': content_type,
+            'Metadata': {
+                'uploaded_at': datetime.now().isoformat(),
+                'source': 't6_media_downloader'
+            }
+        }
+    
     def upload_file(self, file_data: bytes, s3_key: str, content_type: str = None) -> bool:
         """上传文件到S3"""
         if not self.s3_client:
             return False
         
         try:
-            # 自动检测内容类型
-            if not content_type:
-                content_type = mimetypes.guess_type(s3_key)[0] or 'application/octet-stream'
-            
             # 上传文件
             self.s3_client.put_object(
                 Bucket=self.config.s3_bucket,
                 Key=s3_key,
                 Body=file_data,
-                ContentType=content_type,
-                Metadata={
-                    'uploaded_at': datetime.now().isoformat(),
-                    'source': 't6_media_downloader'
-                }
+                **self._upload_args(s3_key, content_type)
+            )
+            
+            logging.debug(f"✅ 上传成功: {s3_key}")
+            return True
+            
+        except Exception as e:
+            logging.error(f"❌ 上传失败 {s3_key}: {e}")
+            return False
+    
+    def upload_fileobj(self, fileobj, s3_key: str, content_type: str = None) -> bool:
+        """从文件对象流式上传到S3，超过分片阈值时分片并发上传"""
+        if not self.s3_client:
+            return False
+        
+        try:
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.config.s3_bucket,
+                s3_key,
+                ExtraArgs=self._upload_args(s3_key, content_type),
+                Config=MULTIPART_CONFIG
             )
             
             logging.debug(f"✅ 上传成功: {s3_key}")
@@ -168,6 +454,47 @@ class S3StorageManager:
         except Exception as e:
             logging.warning(f"检查文件存在性异常 {s3_key}: {e}")
             return False
+    
+    async def upload_fileobj_async(self, client, fileobj, size: int, s3_key: str, content_type: str = None) -> bool:
+        """通过 aioboto3 客户端从文件对象上传，大文件分片并发上传"""
+        try:
+            upload_args = self._upload_args(s3_key, content_type)
+            
+            if size > MULTIPART_THRESHOLD:
+                await client.upload_fileobj(
+                    fileobj,
+                    self.config.s3_bucket,
+                    s3_key,
+                    ExtraArgs=upload_args,
+                    Config=MULTIPART_CONFIG
+                )
+            else:
+                await client.put_object(
+                    Bucket=self.config.s3_bucket,
+                    Key=s3_key,
+                    Body=fileobj.read(),
+                    **upload_args
+                )
+            
+            logging.debug(f"✅ 上传成功: {s3_key}")
+            return True
+            
+        except Exception as e:
+            logging.error(f"❌ 上传失败 {s3_key}: {e}")
+            return False
+    
+    async def file_exists_async(self, client, s3_key: str) -> bool:
+        """通过 aioboto3 客户端检查文件是否已存在"""
+        try:
+            await client.head_object(Bucket=self.config.s3_bucket, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] != '404':
+                logging.warning(f"检查文件存在性失败 {s3_key}: {e}")
+            return False
+        except Exception as e:
+            logging.warning(f"检查文件存在性异常 {s3_key}: {e}")
+            return False
 
 class MediaDownloader:
     """T6媒体下载器主类"""
@@ -176,10 +503,38 @@ class MediaDownloader:
         self.config = config or MediaDownloaderConfig()
         self.setup_logging()
         
+        # 内容哈希算法（hashlib 由 OpenSSL 实现，支持时自动使用 SHA-NI 等硬件指令）
+        self.hash_algorithm = getattr(self.config, 'hash_algorithm', 'sha256')
+        if self.config.verify_hash:
+            self.logger.debug(
+                f"内容哈希: {self.hash_algorithm} ({ssl.OPENSSL_VERSION}, "
+                f"OPENSSL_ia32cap={os.getenv('OPENSSL_ia32cap', '自动检测')})"
+            )
+        
         # 初始化组件
-        self.rate_limiter = RateLimiter(self.config.requests_per_second)
+        self.rate_limiter = AdaptiveTokenBucket(
+            self.config.requests_per_second,
+            getattr(self.config, 'burst', None),
+            rate_min=getattr(self.config, 'rate_min', 0.5),
+            rate_max=getattr(self.config, 'rate_max', None),
+            alpha=getattr(self.config, 'rate_alpha', 0.1),
+            beta=getattr(self.config, 'rate_beta', 0.5)
+        )
         self.s3_manager = S3StorageManager(self.config)
-        self.session = requests.Session()
+        self.http, self.session = self._create_http_clients()
+        
+        # 下载缓冲池：每个并发下载至多占用一块，复用而非每张图片重新分配
+        self.buffer_pool = BufferPool(
+            self.config.max_workers,
+            getattr(self.config, 'buffer_size', SPOOL_MAX_SIZE)
+        )
+        
+        # OSS处理参数只由配置决定，预先拼好查询串
+        self._oss_query = '?' + '/'.join([
+            f"x-oss-process=image/resize,w_{self.config.target_width},m_lfit",
+            f"format,{self.config.target_format}",
+            f"quality,Q_{self.config.quality}"
+        ])
         
         # 统计信息
         self.stats = {
@@ -195,9 +550,15 @@ class MediaDownloader:
         # 线程安全的统计更新
         self.stats_lock = threading.Lock()
         
-        # 设置信号处理
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        # 本批认领的图片id与待写入的状态更新
+        self.claimed_ids: List[int] = []
+        self._pending_updates: List[Tuple] = []
+        self._updates_lock = threading.Lock()
+        
+        # 设置信号处理（只能在主线程注册；在工作线程中创建时跳过）
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.signal_handler)
+            signal.signal(signal.SIGTERM, self.signal_handler)
         
         self.shutdown_requested = False
     
@@ -214,6 +575,33 @@ class MediaDownloader:
         )
         self.logger = logging.getLogger('T6MediaDownloader')
     
+    def _create_http_clients(self):
+        """创建下载用的HTTP客户端：安装 httpx[http2] 时用 HTTP/2 多路复用，否则用连接池放大的 requests 会话"""
+        pool_size = self.config.max_workers * 4
+        
+        http = None
+        if HTTPX_AVAILABLE:
+            http = httpx.Client(
+                http2=True,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                headers=DOWNLOAD_HEADERS
+            )
+        
+        # 默认连接池只保留10个连接，工作线程更多时会频繁丢弃重建连接
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(DOWNLOAD_HEADERS)
+        return http, session
+    
+    def close(self):
+        """关闭HTTP客户端"""
+        if self.http is not None:
+            self.http.close()
+        self.session.close()
+    
     def signal_handler(self, signum, frame):
         """信号处理器"""
         self.logger.info(f"收到信号 {signum}，开始优雅关闭...")
@@ -246,26 +634,7 @@ class MediaDownloader:
             cursor = connection.cursor(dictionary=True)
             
             # 查询待下载的图片
-            query = """
-                SELECT 
-                    wi.id,
-                    wi.work_id,
-                    wi.image_index,
-                    wi.src_url,
-                    wi.s3_key,
-                    wi.status,
-                    w.slug as work_slug,
-                    w.title as work_title
-                FROM work_images wi
-                JOIN works w ON wi.work_id = w.id
-                WHERE wi.status IN ('PENDING', 'FAILED')
-                AND wi.src_url IS NOT NULL
-                AND wi.src_url != ''
-                ORDER BY wi.created_at ASC
-                LIMIT %s
-            """
-            
-            cursor.execute(query, (limit,))
+            cursor.execute(PENDING_IMAGES_QUERY, (limit,))
             images = cursor.fetchall()
             
             self.logger.info(f"找到 {len(images)} 张待下载图片")
@@ -279,154 +648,242 @@ class MediaDownloader:
                 cursor.close()
                 connection.close()
     
+    def claim_pending_images(self, limit: int = 1000) -> List[Dict]:
+        """认领待下载的图片：加锁查询并在同一事务内标记为 IN_PROGRESS"""
+        connection = self.get_database_connection()
+        if not connection:
+            return []
+        
+        try:
+            cursor = connection.cursor(dictionary=True)
+            
+            cursor.execute(CLAIM_IMAGES_QUERY, (limit,))
+            images = cursor.fetchall()
+            
+            self.claimed_ids = [image['id'] for image in images]
+            if self.claimed_ids:
+                cursor.execute(MARK_IN_PROGRESS_QUERY.format(sql_placeholders(len(self.claimed_ids))),
+                               self.claimed_ids)
+            connection.commit()
+            
+            self.logger.info(f"认领 {len(images)} 张待下载图片")
+            return images
+            
+        except Error as e:
+            connection.rollback()
+            self.logger.error(f"认领待下载图片失败: {e}")
+            return []
+        finally:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+    
     def generate_s3_key(self, work_slug: str, image_index: int, original_url: str) -> str:
         """生成S3存储键"""
-        # 解析原始URL获取文件扩展名
-        parsed_url = urlparse(original_url)
-        path = parsed_url.path
-        
-        # 获取文件扩展名
-        if '.' in path:
-            ext = path.split('.')[-1].lower()
-            if ext not in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-                ext = 'jpg'
-        else:
-            ext = 'jpg'
-        
         # 生成S3键：works/{work_slug}/images/{image_index}.{ext}
-        s3_key = f"works/{work_slug}/images/{image_index:03d}.{ext}"
-        return s3_key
+        return f"works/{work_slug}/images/{image_index:03d}.{image_extension(original_url)}"
     
     def process_image_url(self, original_url: str) -> str:
         """处理图片URL，添加OSS处理参数"""
         if not original_url:
             return original_url
         
-        # 移除现有的查询参数
-        base_url = original_url.split('?')[0]
-        
-        # 添加OSS处理参数
-        oss_params = [
-            f"x-oss-process=image/resize,w_{self.config.target_width},m_lfit",
-            f"format,{self.config.target_format}",
-            f"quality,Q_{self.config.quality}"
-        ]
-        
-        processed_url = f"{base_url}?{'/'.join(oss_params)}"
-        return processed_url
+        # 移除现有的查询参数，添加OSS处理参数
+        return original_url.partition('?')[0] + self._oss_query
     
     def download_and_upload_image(self, image_info: Dict) -> Dict:
         """下载并上传单个图片"""
         image_id = image_info['id']
-        work_slug = image_info['work_slug']
-        image_index = image_info['image_index']
-        original_url = image_info['src_url']
         
         try:
             # 生成S3键
-            s3_key = self.generate_s3_key(work_slug, image_index, original_url)
+            s3_key = self.generate_s3_key(image_info['work_slug'], image_info['image_index'], image_info['src_url'])
             
             # 检查S3是否已存在
             if self.s3_manager.file_exists(s3_key):
-                self.logger.debug(f"图片已存在，跳过: {s3_key}")
-                return {
-                    'image_id': image_id,
-                    'status': 'skipped',
-                    's3_key': s3_key,
-                    'message': '图片已存在'
-                }
+                return self._skipped_result(image_id, s3_key)
             
             # 限速等待
             self.rate_limiter.wait_if_needed()
             
             # 处理图片URL
-            processed_url = self.process_image_url(original_url)
+            processed_url = self.process_image_url(image_info['src_url'])
             
-            # 下载图片
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            # 流式下载图片到临时文件
+            with self._open_spool() as spool:
+                hasher = self._new_hasher()
+                try:
+                    content_type = self._stream_download(processed_url, spool, hasher)
+                except DOWNLOAD_TIMEOUT_ERRORS:
+                    self.rate_limiter.on_failure()
+                    raise
+                
+                return self._store_image(image_id, s3_key, spool, hasher, content_type)
             
-            response = self.session.get(
-                processed_url, 
-                headers=headers, 
-                timeout=self.config.timeout
-            )
+        except Exception as e:
+            return self._failed_result(image_id, e)
+    
+    def _stream_download(self, url: str, spool: PooledSpool, hasher) -> str:
+        """按块下载到临时文件并增量计算哈希，返回内容类型"""
+        if self.http is not None:
+            response_cm = self.http.stream('GET', url)
+        else:
+            response_cm = self.session.get(url, timeout=self.config.timeout, stream=True)
+        
+        with response_cm as response:
+            self._record_http_status(response.status_code)
             response.raise_for_status()
             
-            image_data = response.content
-            
-            # 验证文件大小
-            if self.config.verify_size and len(image_data) < self.config.min_file_size:
-                raise ValueError(f"文件大小过小: {len(image_data)} bytes")
-            
-            # 计算内容哈希
-            content_hash = None
-            if self.config.verify_hash:
-                content_hash = hashlib.md5(image_data).hexdigest()
-            
-            # 上传到S3
             content_type = response.headers.get('content-type', 'image/jpeg')
-            if not self.s3_manager.upload_file(image_data, s3_key, content_type):
-                raise Exception("S3上传失败")
-            
-            # 更新数据库状态
-            self.update_image_status(image_id, 'OK', s3_key, content_hash, len(image_data))
-            
-            return {
-                'image_id': image_id,
-                'status': 'success',
-                's3_key': s3_key,
-                'content_hash': content_hash,
-                'size_bytes': len(image_data),
-                'message': '下载并上传成功'
-            }
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.logger.error(f"处理图片失败 {image_id}: {error_msg}")
-            
-            # 更新数据库状态
-            self.update_image_status(image_id, 'FAILED', None, None, None, error_msg)
-            
-            return {
-                'image_id': image_id,
-                'status': 'failed',
-                'error': error_msg,
-                'message': '处理失败'
-            }
+            chunks = (response.iter_bytes(STREAM_CHUNK_SIZE) if self.http is not None
+                      else response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+            for chunk in chunks:
+                spool.write(chunk)
+                if hasher:
+                    hasher.update(chunk)
+        
+        return content_type
+    
+    def _record_http_status(self, status_code: int):
+        """根据源站反馈调整速率"""
+        if status_code == 429 or status_code >= 500:
+            self.rate_limiter.on_failure()
+        elif 200 <= status_code < 300:
+            self.rate_limiter.on_success()
+    
+    def _skipped_result(self, image_id: int, s3_key: str) -> Dict:
+        self.logger.debug(f"图片已存在，跳过: {s3_key}")
+        return {
+            'image_id': image_id,
+            'status': 'skipped',
+            's3_key': s3_key,
+            'message': '图片已存在'
+        }
+    
+    def _open_spool(self) -> PooledSpool:
+        """下载缓冲：使用缓冲池中的内存块，超出容量自动落盘"""
+        return PooledSpool(self.buffer_pool)
+    
+    def _new_hasher(self):
+        """增量内容哈希（未启用哈希校验时为 None）"""
+        return hashlib.new(self.hash_algorithm) if self.config.verify_hash else None
+    
+    def _verify_image(self, size: int, hasher) -> Optional[str]:
+        """校验已下载的图片，返回内容哈希（未启用哈希校验时为 None）"""
+        # 验证文件大小
+        if self.config.verify_size and size < self.config.min_file_size:
+            raise ValueError(f"文件大小过小: {size} bytes")
+        
+        return hasher.hexdigest() if hasher else None
+    
+    def _store_image(self, image_id: int, s3_key: str, spool: PooledSpool, hasher, content_type: str) -> Dict:
+        """校验已下载到临时文件的图片，上传到S3并更新数据库状态"""
+        size = spool.tell()
+        content_hash = self._verify_image(size, hasher)
+        
+        # 上传到S3
+        spool.seek(0)
+        if not self.s3_manager.upload_fileobj(spool, s3_key, content_type):
+            raise Exception("S3上传失败")
+        
+        # 更新数据库状态
+        self.update_image_status(image_id, 'OK', s3_key, content_hash, size)
+        
+        return self._success_result(image_id, s3_key, content_hash, size)
+    
+    def _success_result(self, image_id: int, s3_key: str, content_hash: Optional[str], size_bytes: int) -> Dict:
+        return {
+            'image_id': image_id,
+            'status': 'success',
+            's3_key': s3_key,
+            'content_hash': content_hash,
+            'size_bytes': size_bytes,
+            'message': '下载并上传成功'
+        }
+    
+    def _failed_result(self, image_id: int, error: Exception) -> Dict:
+        """记录失败并更新数据库状态"""
+        result = self._failure_result(image_id, error)
+        
+        # 更新数据库状态
+        self.update_image_status(image_id, 'FAILED', None, None, None, result['error'])
+        
+        return result
+    
+    def _failure_result(self, image_id: int, error: Exception) -> Dict:
+        error_msg = str(error)
+        self.logger.error(f"处理图片失败 {image_id}: {error_msg}")
+        return {
+            'image_id': image_id,
+            'status': 'failed',
+            'error': error_msg,
+            'message': '处理失败'
+        }
     
     def update_image_status(self, image_id: int, status: str, s3_key: str = None, 
                            content_hash: str = None, size_bytes: int = None, 
                            error_message: str = None):
-        """更新图片状态"""
+        """更新图片状态（先缓冲，满 STATUS_FLUSH_SIZE 条后批量写入）"""
+        rows = self._buffer_status_update(image_id, status, s3_key, content_hash, size_bytes)
+        if rows:
+            self._write_status_updates(rows)
+    
+    def _buffer_status_update(self, image_id: int, status: str, s3_key: str = None,
+                              content_hash: str = None, size_bytes: int = None) -> List[Tuple]:
+        """缓冲一条状态更新，缓冲区满时取出全部待写入的行"""
+        if status != 'OK':
+            s3_key = content_hash = size_bytes = None
+        with self._updates_lock:
+            self._pending_updates.append((status, s3_key, content_hash, size_bytes, image_id))
+            if len(self._pending_updates) < STATUS_FLUSH_SIZE:
+                return []
+            rows, self._pending_updates = self._pending_updates, []
+        return rows
+    
+    def _drain_status_updates(self) -> List[Tuple]:
+        with self._updates_lock:
+            rows, self._pending_updates = self._pending_updates, []
+        return rows
+    
+    def _write_status_updates(self, rows: List[Tuple]):
+        """一次连接、一次提交写入多条状态更新"""
         connection = self.get_database_connection()
         if not connection:
             return
         
         try:
             cursor = connection.cursor()
+            cursor.executemany(UPDATE_IMAGE_QUERY, rows)
+            connection.commit()
             
-            if status == 'OK':
-                query = """
-                    UPDATE work_images 
-                    SET status = %s, s3_key = %s, content_hash = %s, 
-                        size_bytes = %s, downloaded_at = NOW()
-                    WHERE id = %s
-                """
-                cursor.execute(query, (status, s3_key, content_hash, size_bytes, image_id))
-            else:
-                query = """
-                    UPDATE work_images 
-                    SET status = %s, downloaded_at = NOW()
-                    WHERE id = %s
-                """
-                cursor.execute(query, (status, image_id))
-            
+        except Error as e:
+            self.logger.error(f"批量更新图片状态失败 ({len(rows)} 条): {e}")
+        finally:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+    
+    def flush_status_updates(self):
+        """写入缓冲的状态更新，并释放本批未处理完的认领行"""
+        rows = self._drain_status_updates()
+        if rows:
+            self._write_status_updates(rows)
+        
+        claimed_ids, self.claimed_ids = self.claimed_ids, []
+        if not claimed_ids:
+            return
+        
+        connection = self.get_database_connection()
+        if not connection:
+            return
+        
+        try:
+            cursor = connection.cursor()
+            cursor.execute(RELEASE_CLAIMED_QUERY.format(sql_placeholders(len(claimed_ids))), claimed_ids)
             connection.commit()
             
         except Error as e:
-            self.logger.error(f"更新图片状态失败 {image_id}: {e}")
+            self.logger.error(f"释放认领图片失败: {e}")
         finally:
             if connection.is_connected():
                 cursor.close()
@@ -434,28 +891,10 @@ class MediaDownloader:
     
     def download_batch(self, max_images: int = 1000) -> Dict:
         """批量下载图片"""
-        self.logger.info("开始批量下载图片...")
-        
-        # 重置统计
-        self.stats = {
-            'total': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0,
-            'retried': 0,
-            'start_time': datetime.now(),
-            'end_time': None
-        }
-        
-        # 获取待下载图片
-        images = self.get_pending_images(max_images)
+        images = self._start_batch(max_images)
         if not images:
-            self.logger.warning("没有找到待下载的图片")
             return self.stats
         
-        self.stats['total'] = len(images)
-        self.logger.info(f"开始处理 {len(images)} 张图片")
-        
         # 并发下载
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
             # 提交所有任务
@@ -471,22 +910,58 @@ class MediaDownloader:
                     break
                 
                 try:
-                    result = future.result()
-                    self.update_stats(result['status'])
-                    
-                    # 记录结果
-                    if result['status'] == 'success':
-                        self.logger.debug(f"✅ 成功: {result['s3_key']}")
-                    elif result['status'] == 'skipped':
-                        self.logger.debug(f"⏭️  跳过: {result['message']}")
-                    else:
-                        self.logger.warning(f"❌ 失败: {result['error']}")
-                        
+                    self._record_result(future.result())
                 except Exception as e:
                     self.logger.error(f"任务执行异常: {e}")
                     self.update_stats('failed')
         
-        # 完成统计
+        self.flush_status_updates()
+        return self._finish_batch()
+    
+    def _start_batch(self, max_images: int) -> List[Dict]:
+        """重置统计并获取本批待下载图片"""
+        self._reset_stats()
+        return self._accept_batch(self.claim_pending_images(max_images))
+    
+    def _reset_stats(self):
+        """开始新批次：重置统计"""
+        self.logger.info("开始批量下载图片...")
+        
+        # 重置统计
+        self.stats = {
+            'total': 0,
+            'successful': 0,
+            'failed': 0,
+            'skipped': 0,
+            'retried': 0,
+            'start_time': datetime.now(),
+            'end_time': None
+        }
+    
+    def _accept_batch(self, images: List[Dict]) -> List[Dict]:
+        """登记本批待下载图片数量"""
+        if not images:
+            self.logger.warning("没有找到待下载的图片")
+            return []
+        
+        self.stats['total'] = len(images)
+        self.logger.info(f"开始处理 {len(images)} 张图片")
+        return images
+    
+    def _record_result(self, result: Dict):
+        """累计单张图片的处理结果"""
+        self.update_stats(result['status'])
+        
+        # 记录结果
+        if result['status'] == 'success':
+            self.logger.debug(f"✅ 成功: {result['s3_key']}")
+        elif result['status'] == 'skipped':
+            self.logger.debug(f"⏭️  跳过: {result['message']}")
+        else:
+            self.logger.warning(f"❌ 失败: {result['error']}")
+    
+    def _finish_batch(self) -> Dict:
+        """完成统计并输出本批结果"""
         self.stats['end_time'] = datetime.now()
         duration = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
         
@@ -596,6 +1071,8 @@ def main():
     except Exception as e:
         print(f"程序异常: {e}")
         logging.error(f"程序异常: {e}", exc_info=True)
+    finally:
+        downloader.close()
 
 if __name__ == "__main__":
     main()
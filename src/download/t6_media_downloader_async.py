@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+T6 媒体下载器（异步版本）
+基于 asyncio + aiohttp，单线程事件循环驱动大量并发下载，连接池复用 TCP/TLS 会话
+安装 aioboto3 时 S3 存在性检查与上传走异步客户端（大文件分片并发上传），
+安装 asyncmy（C扩展，优先）或 aiomysql 时数据库查询与状态更新走异步连接池，复用长连接；
+缺少对应依赖时使用同步客户端，放到线程池中执行；
+作为脚本运行时如已安装 uvloop 则使用 uvloop 事件循环
+"""
+
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import Dict, List
+
+import aiohttp
+
+# 异步MySQL驱动：优先 asyncmy（Cython 实现，结果集解码更快），其次 aiomysql
+try:
+    import asyncmy as async_mysql
+    from asyncmy.cursors import DictCursor
+    ASYNC_MYSQL_DRIVER = 'asyncmy'
+except ImportError:
+    try:
+        import aiomysql as async_mysql
+        from aiomysql import DictCursor
+        ASYNC_MYSQL_DRIVER = 'aiomysql'
+    except ImportError:
+        ASYNC_MYSQL_DRIVER = None
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from t6_media_downloader import (
+    AIOBOTO3_AVAILABLE, CLAIM_IMAGES_QUERY, DOWNLOAD_HEADERS, MARK_IN_PROGRESS_QUERY, RELEASE_CLAIMED_QUERY,
+    STREAM_CHUNK_SIZE, UPDATE_IMAGE_QUERY, MediaDownloader, MediaDownloaderConfig, sql_placeholders
+)
+
+# 每个工作线程配额对应的并发下载数（协程远比线程轻量）
+CONCURRENCY_PER_WORKER = 4
+
+class AsyncMediaDownloader(MediaDownloader):
+    """T6媒体下载器异步版本"""
+
+    def __init__(self, config: MediaDownloaderConfig = None):
+        super().__init__(config)
+        self.db_pool = None
+
+    async def startup(self):
+        """创建数据库连接池（未安装异步MySQL驱动时跳过）"""
+        if ASYNC_MYSQL_DRIVER is None or self.db_pool is not None:
+            return
+        # 库名参数：asyncmy 为 database，aiomysql 为 db
+        db_arg = 'database' if ASYNC_MYSQL_DRIVER == 'asyncmy' else 'db'
+        try:
+            self.db_pool = await async_mysql.create_pool(
+                host=self.config.db_host,
+                port=self.config.db_port,
+                user=self.config.db_user,
+                password=self.config.db_password,
+                charset='utf8mb4',
+                minsize=2,
+                maxsize=self.config.max_workers,
+                autocommit=False,
+                **{db_arg: self.config.db_name}
+            )
+            self.logger.info(f"数据库连接池已创建（{ASYNC_MYSQL_DRIVER}）")
+        except Exception as e:
+            self.logger.error(f"数据库连接池创建失败: {e}")
+
+    async def shutdown(self):
+        """关闭数据库连接池"""
+        if self.db_pool is not None:
+            self.db_pool.close()
+            await self.db_pool.wait_closed()
+            self.db_pool = None
+
+    async def claim_pending_images_async(self, limit: int = 1000) -> List[Dict]:
+        """认领待下载的图片（协程）"""
+        if self.db_pool is None:
+            return await asyncio.to_thread(self.claim_pending_images, limit)
+
+        try:
+            async with self.db_pool.acquire() as conn, conn.cursor(DictCursor) as cursor:
+                try:
+                    await cursor.execute(CLAIM_IMAGES_QUERY, (limit,))
+                    images = list(await cursor.fetchall())
+
+                    self.claimed_ids = [image['id'] for image in images]
+                    if self.claimed_ids:
+                        await cursor.execute(MARK_IN_PROGRESS_QUERY.format(sql_placeholders(len(self.claimed_ids))),
+                                             self.claimed_ids)
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+
+            self.logger.info(f"认领 {len(images)} 张待下载图片")
+            return images
+
+        except Exception as e:
+            self.logger.error(f"认领待下载图片失败: {e}")
+            return []
+
+    async def update_image_status_async(self, image_id: int, status: str, s3_key: str = None,
+                                        content_hash: str = None, size_bytes: int = None):
+        """更新图片状态（协程，先缓冲，满后批量写入）"""
+        rows = self._buffer_status_update(image_id, status, s3_key, content_hash, size_bytes)
+        if rows:
+            await self._write_status_updates_async(rows)
+
+    async def _write_status_updates_async(self, rows):
+        if self.db_pool is None:
+            await asyncio.to_thread(self._write_status_updates, rows)
+            return
+
+        try:
+            async with self.db_pool.acquire() as conn, conn.cursor() as cursor:
+                await cursor.executemany(UPDATE_IMAGE_QUERY, rows)
+                await conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"批量更新图片状态失败 ({len(rows)} 条): {e}")
+
+    async def flush_status_updates_async(self):
+        """写入缓冲的状态更新，并释放本批未处理完的认领行（协程）"""
+        if self.db_pool is None:
+            await asyncio.to_thread(self.flush_status_updates)
+            return
+
+        rows = self._drain_status_updates()
+        if rows:
+            await self._write_status_updates_async(rows)
+
+        claimed_ids, self.claimed_ids = self.claimed_ids, []
+        if not claimed_ids:
+            return
+
+        try:
+            async with self.db_pool.acquire() as conn, conn.cursor() as cursor:
+                await cursor.execute(RELEASE_CLAIMED_QUERY.format(sql_placeholders(len(claimed_ids))), claimed_ids)
+                await conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"释放认领图片失败: {e}")
+
+    async def download_image_async(self, http: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                   image_info: Dict, s3=None) -> Dict:
+        """下载并上传单个图片（协程）"""
+        image_id = image_info['id']
+
+        async with semaphore:
+            try:
+                # 生成S3键
+                s3_key = self.generate_s3_key(image_info['work_slug'], image_info['image_index'], image_info['src_url'])
+
+                # 检查S3是否已存在
+                if s3 is not None:
+                    exists = await self.s3_manager.file_exists_async(s3, s3_key)
+                else:
+                    exists = await asyncio.to_thread(self.s3_manager.file_exists, s3_key)
+                if exists:
+                    return self._skipped_result(image_id, s3_key)
+
+                # 限速等待
+                await self.rate_limiter.acquire()
+
+                # 流式下载图片到临时文件
+                processed_url = self.process_image_url(image_info['src_url'])
+                with self._open_spool() as spool:
+                    hasher = self._new_hasher()
+                    try:
+                        async with http.get(processed_url) as response:
+                            self._record_http_status(response.status)
+                            response.raise_for_status()
+                            content_type = response.headers.get('Content-Type', 'image/jpeg')
+                            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                                spool.write(chunk)
+                                if hasher:
+                                    hasher.update(chunk)
+                    except asyncio.TimeoutError:
+                        self.rate_limiter.on_failure()
+                        raise
+
+                    size = spool.tell()
+                    content_hash = self._verify_image(size, hasher)
+
+                    # 上传到S3
+                    spool.seek(0)
+                    if s3 is not None:
+                        uploaded = await self.s3_manager.upload_fileobj_async(s3, spool, size, s3_key, content_type)
+                    else:
+                        uploaded = await asyncio.to_thread(self.s3_manager.upload_fileobj, spool, s3_key, content_type)
+                    if not uploaded:
+                        raise Exception("S3上传失败")
+
+                # 更新数据库状态
+                await self.update_image_status_async(image_id, 'OK', s3_key, content_hash, size)
+                return self._success_result(image_id, s3_key, content_hash, size)
+
+            except Exception as e:
+                result = self._failure_result(image_id, e)
+                await self.update_image_status_async(image_id, 'FAILED')
+                return result
+
+    async def download_batch_async(self, max_images: int = 1000) -> Dict:
+        """批量下载图片（协程）"""
+        await self.startup()
+        try:
+            return await self._download_batch_async(max_images)
+        finally:
+            await self.shutdown()
+
+    async def _download_batch_async(self, max_images: int) -> Dict:
+        self._reset_stats()
+        images = self._accept_batch(await self.claim_pending_images_async(max_images))
+        if not images:
+            return self.stats
+
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_workers * 10,
+            limit_per_host=self.config.max_workers
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        semaphore = asyncio.Semaphore(self.config.max_workers * CONCURRENCY_PER_WORKER)
+
+        async with AsyncExitStack() as stack:
+            http = await stack.enter_async_context(aiohttp.ClientSession(
+                connector=connector, timeout=timeout, headers=DOWNLOAD_HEADERS
+            ))
+            s3 = None
+            if AIOBOTO3_AVAILABLE and self.s3_manager.s3_client:
+                s3 = await stack.enter_async_context(self.s3_manager.async_client())
+            results = await asyncio.gather(
+                *(self.download_image_async(http, semaphore, image, s3) for image in images),
+                return_exceptions=True
+            )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error(f"任务执行异常: {result}")
+                self.update_stats('failed')
+            else:
+                self._record_result(result)
+
+        await self.flush_status_updates_async()
+        return self._finish_batch()
+
+    def download_batch(self, max_images: int = 1000) -> Dict:
+        """批量下载图片（同步入口，内部运行事件循环）"""
+        return asyncio.run(self.download_batch_async(max_images))
+
+def install_event_loop():
+    """安装 uvloop 事件循环（libuv 实现，回调调度在C层完成）；未安装时使用默认事件循环"""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return UVLOOP_AVAILABLE
+
+def main():
+    """主函数"""
+    if install_event_loop():
+        logging.info("使用 uvloop 事件循环")
+
+    downloader = AsyncMediaDownloader(MediaDownloaderConfig())
+
+    try:
+        stats = downloader.download_batch()
+
+        # 如果有失败的图片，尝试重试
+        if stats['failed'] > 0:
+            print(f"\n发现 {stats['failed']} 张失败的图片，开始重试...")
+            downloader.retry_failed_images()
+
+    except KeyboardInterrupt:
+        print("\n用户中断，正在关闭...")
+    except Exception as e:
+        print(f"程序异常: {e}")
+        logging.error(f"程序异常: {e}", exc_info=True)
+    finally:
+        downloader.close()
+
+if __name__ == "__main__":
+    main()
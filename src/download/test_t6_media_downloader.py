@@ -10,6 +10,8 @@ import sys
 import time
 from dotenv import load_dotenv
 
+from t6_concurrent_runner import run_concurrently
+
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
@@ -258,39 +260,33 @@ def run_all_tests():
         ("OSS处理URL", test_oss_process_url)
     ]
     
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            test_results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} 测试异常: {e}")
-            test_results.append((test_name, False))
-    
-    # 输出测试结果摘要
-    print("\n" + "=" * 60)
-    print("📊 测试结果摘要")
-    print("=" * 60)
+    # 各项测试互不依赖，并发执行以重叠网络等待，输出按原顺序整体打印
+    for test_name, result in run_concurrently(tests):
+        if isinstance(result, Exception):
+            print(f"❌ {test_name} 测试异常: {result}")
+            result = False
+        test_results.append((test_name, result))
     
-    passed = 0
+    # 输出测试结果摘要（整体拼接后一次写出）
     total = len(test_results)
+    passed = sum(1 for _, result in test_results if result)
     
-    for test_name, result in test_results:
-        status = "✅ 通过" if result else "❌ 失败"
-        print(f"{test_name}: {status}")
-        if result:
-            passed += 1
-    
-    print(f"\n总计: {total} 项测试")
-    print(f"通过: {passed} 项")
-    print(f"失败: {total - passed} 项")
-    print(f"成功率: {(passed / total) * 100:.1f}%")
+    lines = ["", "=" * 60, "📊 测试结果摘要", "=" * 60]
+    lines += [f"{test_name}: {'✅ 通过' if result else '❌ 失败'}" for test_name, result in test_results]
+    lines += [
+        f"\n总计: {total} 项测试",
+        f"通过: {passed} 项",
+        f"失败: {total - passed} 项",
+        f"成功率: {(passed / total) * 100:.1f}%"
+    ]
     
     if passed == total:
-        print("\n🎉 所有测试通过！T6媒体下载器准备就绪")
-        return True
+        lines.append("\n🎉 所有测试通过！T6媒体下载器准备就绪")
     else:
-        print(f"\n⚠️  有 {total - passed} 项测试失败，请检查配置和依赖")
-        return False
+        lines.append(f"\n⚠️  有 {total - passed} 项测试失败，请检查配置和依赖")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return passed == total
 
 if __name__ == "__main__":
     success = run_all_tests()
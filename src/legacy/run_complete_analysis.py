@@ -6,39 +6,102 @@
 
 import os
 import sys
-import subprocess
 import time
+import asyncio
+import hashlib
+import importlib
+from importlib.util import find_spec
 from datetime import datetime
+from pathlib import Path
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# 子脚本所在目录加入导入路径，各阶段在当前进程内直接调用其 main()，
+# 省去每阶段重新启动解释器与重复导入依赖的开销
+SRC_DIR = Path(__file__).resolve().parent.parent
+for stage_dir in ('scraping', 'analysis'):
+    stage_path = str(SRC_DIR / stage_dir)
+    if stage_path not in sys.path:
+        sys.path.insert(0, stage_path)
+
+# 横幅与分隔线固定不变，模块加载时拼好，打印时直接写出
+RULE = "=" * 60
+SECTION_RULE = "=" * 50
+BANNER = "\n".join([
+    RULE,
+    "🚗 LiblibAI 汽车交通设计趋势完整分析系统",
+    RULE,
+    "📊 为设计师提供专业的趋势洞察和市场分析",
+    "🎯 涵盖数据采集、图片下载、趋势分析全流程",
+    RULE,
+    ""
+]) + "\n"
+
 def print_banner():
-    """打印程序横幅"""
-    print("=" * 60)
-    print("🚗 LiblibAI 汽车交通设计趋势完整分析系统")
-    print("=" * 60)
-    print("📊 为设计师提供专业的趋势洞察和市场分析")
-    print("🎯 涵盖数据采集、图片下载、趋势分析全流程")
-    print("=" * 60)
-    print()
+    """打印程序横幅（一次写出）"""
+    sys.stdout.write(BANNER)
+
+def print_section(title):
+    """打印阶段标题（一次写出）"""
+    sys.stdout.write(f"\n{SECTION_RULE}\n{title}\n{SECTION_RULE}\n")
+
+REQUIRED_PACKAGES = (
+    'requests', 'matplotlib', 'seaborn', 'pandas',
+    'jieba', 'wordcloud', 'numpy'
+)
+
+# 依赖检查通过后写入的标记文件，内容为当前环境指纹；指纹未变时跳过逐包检查
+DEPS_STAMP_FILE = '.deps_ok'
+
+def dependency_fingerprint():
+    """当前解释器与导入路径的指纹：安装或卸载包会改变 site-packages 目录的 mtime"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{sys.executable}\0{sys.version}\0{','.join(REQUIRED_PACKAGES)}\0".encode('utf-8'))
+    cwd = os.getcwd()
+    for entry in sys.path:
+        # 当前目录随输出文件（含标记文件本身）频繁变化，不计入指纹
+        if os.path.abspath(entry or '.') == cwd:
+            continue
+        try:
+            mtime_ns = os.stat(entry).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        h.update(f"{entry}\0{mtime_ns}\0".encode('utf-8'))
+    return h.hexdigest()
 
 def check_dependencies():
     """检查依赖项"""
     print("🔍 检查系统依赖...")
     
-    required_packages = [
-        'requests', 'matplotlib', 'seaborn', 'pandas',
-        'jieba', 'wordcloud', 'numpy'
-    ]
+    fingerprint = dependency_fingerprint()
+    try:
+        with open(DEPS_STAMP_FILE, 'r', encoding='utf-8') as f:
+            if f.read().strip() == fingerprint:
+                print("✅ 依赖环境未变化，跳过逐项检查")
+                return True
+    except OSError:
+        pass
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✅ {package}")
-        except ImportError:
+    # 只查找模块规格而不执行模块代码，避免仅为检查而导入 matplotlib、pandas 等重量级包
+    for package in REQUIRED_PACKAGES:
+        if find_spec(package) is None:
             missing_packages.append(package)
             print(f"❌ {package} (缺失)")
+        else:
+            print(f"✅ {package}")
     
     if missing_packages:
         print(f"\n⚠️ 缺少以下依赖包: {', '.join(missing_packages)}")
@@ -47,29 +110,34 @@ def check_dependencies():
         return False
     
     print("✅ 所有依赖项检查通过")
+    
+    try:
+        with open(DEPS_STAMP_FILE, 'w', encoding='utf-8') as f:
+            f.write(fingerprint)
+    except OSError:
+        pass
     return True
 
+def run_stage_main(module_name):
+    """在当前进程内导入子脚本并执行其 main()，输出直接写到控制台"""
+    module = importlib.import_module(module_name)
+    try:
+        module.main()
+    except SystemExit as e:
+        # 子脚本以 sys.exit(0)/sys.exit() 结束视为成功，其余退出码视为失败
+        if e.code not in (None, 0):
+            raise RuntimeError(f"{module_name} 退出码 {e.code}") from e
+
 def run_data_collection():
     """运行数据采集"""
-    print("\n" + "="*50)
-    print("📥 第一阶段: 数据采集")
-    print("="*50)
+    print_section("📥 第一阶段: 数据采集")
     
     start_time = time.time()
     
     try:
         print("🚀 启动汽车交通模型采集器...")
-        result = subprocess.run([
-            sys.executable, 'complete_car_scraper.py'
-        ], capture_output=True, text=True, encoding='utf-8')
-        
-        if result.returncode == 0:
-            print("✅ 数据采集完成")
-            print(result.stdout)
-        else:
-            print("❌ 数据采集失败")
-            print(result.stderr)
-            return False
+        run_stage_main('complete_car_scraper')
+        print("✅ 数据采集完成")
             
     except Exception as e:
         print(f"❌ 采集过程异常: {e}")
@@ -82,9 +150,7 @@ def run_data_collection():
 
 def run_trend_analysis():
     """运行趋势分析"""
-    print("\n" + "="*50)
-    print("📊 第二阶段: 趋势分析")
-    print("="*50)
+    print_section("📊 第二阶段: 趋势分析")
     
     start_time = time.time()
     
@@ -97,17 +163,8 @@ def run_trend_analysis():
     
     try:
         print("🎯 启动趋势分析器...")
-        result = subprocess.run([
-            sys.executable, 'car_design_trend_analyzer.py'
-        ], capture_output=True, text=True, encoding='utf-8')
-        
-        if result.returncode == 0:
-            print("✅ 趋势分析完成")
-            print(result.stdout)
-        else:
-            print("❌ 趋势分析失败")
-            print(result.stderr)
-            return False
+        run_stage_main('car_design_trend_analyzer')
+        print("✅ 趋势分析完成")
             
     except Exception as e:
         print(f"❌ 分析过程异常: {e}")
@@ -118,32 +175,53 @@ def run_trend_analysis():
     
     return True
 
-def generate_summary_report():
-    """生成汇总报告"""
-    print("\n" + "="*50)
-    print("📋 第三阶段: 汇总报告")
-    print("="*50)
+def load_json_report(path, keys):
+    """读取JSON报告中指定的顶层字段，文件不存在时返回空字典
     
+    安装了 ijson 时逐个顶层字段流式解析，所需字段取齐即停止，不构建完整的对象树。
+    """
+    # 直接打开并捕获 FileNotFoundError，省去先 stat 判断存在再 open 的一次系统调用
     try:
-        # 读取采集统计
-        collection_stats_file = 'car_models_complete/collection_statistics.json'
-        if os.path.exists(collection_stats_file):
-            with open(collection_stats_file, 'r', encoding='utf-8') as f:
-                collection_stats = json.load(f)
-        else:
-            collection_stats = {}
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return {}
+    
+    with f:
+        if not IJSON_AVAILABLE:
+            # 原始字节直接交给解析器，orjson 可用时省去先解码为 str 的中间副本
+            raw = f.read()
+            report = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            return {key: report[key] for key in keys if key in report}
         
-        # 读取趋势报告
-        trend_report_file = 'trend_analysis_output/car_design_trend_report.json'
-        if os.path.exists(trend_report_file):
-            with open(trend_report_file, 'r', encoding='utf-8') as f:
-                trend_report = json.load(f)
-        else:
-            trend_report = {}
+        wanted = set(keys)
+        report = {}
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            if key in wanted:
+                report[key] = value
+                wanted.discard(key)
+                if not wanted:
+                    break
+    return report
+
+async def generate_summary_report():
+    """生成汇总报告"""
+    print_section("📋 第三阶段: 汇总报告")
+    
+    try:
+        # 采集统计与趋势报告互不依赖，在线程池中并行读取
+        loop = asyncio.get_running_loop()
+        collection_stats, trend_report = await asyncio.gather(
+            loop.run_in_executor(None, load_json_report, 'car_models_complete/collection_statistics.json',
+                                 ('collection_summary',)),
+            loop.run_in_executor(None, load_json_report, 'trend_analysis_output/car_design_trend_report.json',
+                                 ('executive_summary', 'design_recommendations', 'market_opportunities'))
+        )
         
-        # 生成汇总
+        # 生成汇总：完成时间以整数纳秒时间戳记录，ISO 字符串由同一读数换算，保留给人工查看报告
+        completed_at_ns = time.time_ns()
         summary = {
-            'analysis_completed_at': datetime.now().isoformat(),
+            'analysis_completed_at': datetime.fromtimestamp(completed_at_ns / 1e9).isoformat(),
+            'analysis_completed_at_ns': completed_at_ns,
             'collection_summary': collection_stats.get('collection_summary', {}),
             'trend_insights': trend_report.get('executive_summary', {}),
             'output_files': {
@@ -164,8 +242,22 @@ def generate_summary_report():
         
         # 保存汇总报告
         summary_file = 'complete_analysis_summary.json'
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            # orjson 直接输出 UTF-8 字节
+            data = orjson.dumps(
+                summary,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            data = json.dumps(summary, ensure_ascii=False, indent=2).encode('utf-8')
+        
+        # 先写同目录临时文件并落盘，再 os.replace 原子替换，中途崩溃不会留下半截的汇总文件
+        tmp_file = f"{summary_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, summary_file)
         
         print("✅ 汇总报告生成完成")
         return summary
@@ -175,59 +267,66 @@ def generate_summary_report():
         return None
 
 def print_final_results(summary):
-    """打印最终结果"""
-    print("\n" + "="*60)
-    print("🎉 分析完成！结果汇总")
-    print("="*60)
+    """打印最终结果（整体拼接后一次写出）"""
+    lines = ["\n" + RULE, "🎉 分析完成！结果汇总", RULE]
     
     if not summary:
-        print("❌ 无法生成结果汇总")
+        lines.append("❌ 无法生成结果汇总")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
-    collection_summary = summary.get('collection_summary', {})
-    trend_insights = summary.get('trend_insights', {})
+    # 各部分只取一次；上游报告中字段为 null 时按空值处理
+    collection_summary = summary.get('collection_summary') or {}
+    trend_insights = summary.get('trend_insights') or {}
+    output_files = summary.get('output_files') or {}
+    recommendations = summary.get('recommendations') or []
+    opportunities = summary.get('market_opportunities') or []
     
-    print("📊 数据采集结果:")
-    print(f"   总计模型: {collection_summary.get('total_models', 'N/A')}")
-    print(f"   图片数量: {collection_summary.get('total_images', 'N/A')}")
-    print(f"   成功下载: {collection_summary.get('total_downloads', 'N/A')}")
+    lines += [
+        "📊 数据采集结果:",
+        f"   总计模型: {collection_summary.get('total_models', 'N/A')}",
+        f"   图片数量: {collection_summary.get('total_images', 'N/A')}",
+        f"   成功下载: {collection_summary.get('total_downloads', 'N/A')}"
+    ]
     
-    print("\n🎯 趋势洞察:")
-    trending_vehicles = trend_insights.get('trending_vehicles', [])
+    lines.append("\n🎯 趋势洞察:")
+    trending_vehicles = trend_insights.get('trending_vehicles')
     if trending_vehicles:
-        print(f"   热门车型: {', '.join(trending_vehicles[:3])}")
+        lines.append(f"   热门车型: {', '.join(trending_vehicles[:3])}")
     
-    popular_styles = trend_insights.get('popular_styles', [])
+    popular_styles = trend_insights.get('popular_styles')
     if popular_styles:
-        print(f"   流行风格: {', '.join(popular_styles[:3])}")
+        lines.append(f"   流行风格: {', '.join(popular_styles[:3])}")
     
-    top_creators = trend_insights.get('top_creators', [])
+    top_creators = trend_insights.get('top_creators')
     if top_creators:
-        print(f"   顶级设计师: {', '.join(top_creators[:3])}")
+        lines.append(f"   顶级设计师: {', '.join(top_creators[:3])}")
     
-    print("\n📁 输出文件:")
-    output_files = summary.get('output_files', {})
-    print(f"   数据目录: {output_files.get('data_directory', 'N/A')}")
-    print(f"   图片目录: {output_files.get('images_directory', 'N/A')}")
-    print(f"   分析目录: {output_files.get('analysis_directory', 'N/A')}")
-    print(f"   趋势报告: {output_files.get('trend_report', 'N/A')}")
+    lines += [
+        "\n📁 输出文件:",
+        f"   数据目录: {output_files.get('data_directory', 'N/A')}",
+        f"   图片目录: {output_files.get('images_directory', 'N/A')}",
+        f"   分析目录: {output_files.get('analysis_directory', 'N/A')}",
+        f"   趋势报告: {output_files.get('trend_report', 'N/A')}"
+    ]
     
-    print("\n💡 设计建议:")
-    recommendations = summary.get('recommendations', [])
+    lines.append("\n💡 设计建议:")
     for i, rec in enumerate(recommendations[:3], 1):
-        print(f"   {i}. {rec.get('recommendation', '')}")
+        lines.append(f"   {i}. {rec.get('recommendation', '')}")
     
-    print("\n🚀 市场机会:")
-    opportunities = summary.get('market_opportunities', [])
+    lines.append("\n🚀 市场机会:")
     for i, opp in enumerate(opportunities[:3], 1):
-        print(f"   {i}. {opp.get('opportunity', '')}")
+        lines.append(f"   {i}. {opp.get('opportunity', '')}")
     
-    print("\n" + "="*60)
-    print("✨ 分析流程全部完成，数据和报告已保存")
-    print("📖 查看 trend_analysis_output/trend_report.md 获取详细报告")
-    print("="*60)
+    lines += [
+        "\n" + RULE,
+        "✨ 分析流程全部完成，数据和报告已保存",
+        "📖 查看 trend_analysis_output/trend_report.md 获取详细报告",
+        RULE
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def main():
+async def main():
     """主函数"""
     print_banner()
     
@@ -238,18 +337,26 @@ def main():
     start_time = time.time()
     
     try:
+        # 趋势分析依赖采集产出的数据文件，两阶段只能先后执行；
+        # 但分析器的模块导入（matplotlib.pyplot、jieba 等）与采集无关，提前提交到线程池与采集重叠
+        loop = asyncio.get_running_loop()
+        analyzer_import = loop.run_in_executor(None, importlib.import_module, 'car_design_trend_analyzer')
+        
         # 第一阶段：数据采集
         if not run_data_collection():
             print("❌ 数据采集失败，终止流程")
             sys.exit(1)
         
+        # 预导入失败时由趋势分析阶段重新导入并报告错误
+        await asyncio.gather(analyzer_import, return_exceptions=True)
+        
         # 第二阶段：趋势分析
         if not run_trend_analysis():
             print("❌ 趋势分析失败，终止流程")
             sys.exit(1)
         
         # 第三阶段：汇总报告
-        summary = generate_summary_report()
+        summary = await generate_summary_report()
         
         # 打印最终结果
         print_final_results(summary)
@@ -265,4 +372,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
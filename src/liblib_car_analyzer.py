@@ -44,7 +44,6 @@ from pathlib import Path
 import requests
 import pandas as pd
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 from urllib.parse import urlparse, urljoin
 import re
@@ -62,6 +61,16 @@ except ImportError:
         def load_config(self):
             return {}
 
+# httpx[http2]（可选依赖）：安装后采集与下载走 HTTP/2 异步客户端，否则把 requests 会话放到线程池中执行
+try:
+    import httpx
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+REQUEST_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+
 # 尝试导入Playwright（可选依赖）
 try:
     from playwright.async_api import async_playwright
@@ -81,7 +90,8 @@ class LiblibCarModelsAnalyzer:
         
         # 加载配置
         if config:
-            self.config_manager.config_data = config
+            # 传入的可能是只读视图（get_effective_config），复制为可修改的字典
+            self.config_manager.config_data = dict(config)
         else:
             self.config_manager.load_config()
         
@@ -159,38 +169,72 @@ class LiblibCarModelsAnalyzer:
     
     def _setup_session(self):
         """设置HTTP会话"""
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
             'Referer': 'https://www.liblib.art/',
             'Origin': 'https://www.liblib.art'
-        })
+        }
         cookie = self.config_manager.get('api.cookie')
         if cookie:
-            self.session.headers.update({'Cookie': cookie})
+            self.headers['Cookie'] = cookie
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # 异步客户端绑定创建它的事件循环，在首次请求时创建
+        self.client = None
+        self._client_loop = None
         
         # 设置超时和重试配置
         self.timeout = self.config_manager.get('api.timeout', 30)
         self.retry_times = self.config_manager.get('api.retry_times', 3)
         self.retry_delay = self.config_manager.get('api.retry_delay', 2)
     
-    def safe_request(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
-        """安全的HTTP请求，支持重试"""
+    def _get_client(self):
+        """返回当前事件循环上的 httpx.AsyncClient，HTTP/2 下同一主机的并发请求复用一条连接"""
+        loop = asyncio.get_running_loop()
+        if self.client is None or self._client_loop is not loop:
+            self.client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+            self._client_loop = loop
+        return self.client
+    
+    async def aclose(self):
+        """关闭异步HTTP客户端"""
+        if self.client is not None:
+            client, self.client = self.client, None
+            if self._client_loop is asyncio.get_running_loop():
+                await client.aclose()
+            self._client_loop = None
+    
+    def _concurrency(self) -> int:
+        """并发请求数上限"""
+        return max(1, self.config['max_workers'])
+    
+    async def safe_request(self, method: str, url: str, **kwargs):
+        """安全的HTTP请求，支持重试（协程）"""
         for attempt in range(self.retry_times):
             try:
-                response = self.session.request(
-                    method, url, 
-                    timeout=self.timeout,
-                    **kwargs
-                )
+                if HTTPX_AVAILABLE:
+                    response = await self._get_client().request(method, url, **kwargs)
+                else:
+                    response = await asyncio.to_thread(
+                        self.session.request, method, url,
+                        timeout=self.timeout,
+                        **kwargs
+                    )
                 response.raise_for_status()
                 return response
-            except requests.RequestException as e:
+            except REQUEST_ERRORS as e:
                 self.logger.warning(f"请求失败 (尝试 {attempt + 1}/{self.retry_times}) {url}: {e}")
                 if attempt < self.retry_times - 1:
-                    time.sleep(self.retry_delay ** attempt)
+                    await asyncio.sleep(self.retry_delay ** attempt)
         return None
     
     def get_timestamp(self) -> int:
@@ -205,23 +249,30 @@ class LiblibCarModelsAnalyzer:
         max_pages = self.config_manager.get('scraping.max_pages', 10)
         delay_between_pages = self.config_manager.get('scraping.delay_between_pages', 1)
         
-        for page in range(1, max_pages + 1):
-            models = self._get_models_by_page(page)
-            if not models:
-                self.logger.info(f"第{page}页无数据，停止采集")
-                break
+        # 按并发数分批并发请求多页，批内按页序合并；遇到空页即停止，批间保留延时避免请求过快
+        batch_size = self._concurrency()
+        for first_page in range(1, max_pages + 1, batch_size):
+            pages = range(first_page, min(first_page + batch_size, max_pages + 1))
+            results = await asyncio.gather(*(self._get_models_by_page(page) for page in pages))
             
-            all_models.extend(models)
-            self.logger.info(f"第{page}页采集到{len(models)}个模型")
+            exhausted = False
+            for page, models in zip(pages, results):
+                if not models:
+                    self.logger.info(f"第{page}页无数据，停止采集")
+                    exhausted = True
+                    break
+                all_models.extend(models)
+                self.logger.info(f"第{page}页采集到{len(models)}个模型")
             
-            # 避免请求过快
-            if page < max_pages:
-                time.sleep(delay_between_pages)
+            if exhausted:
+                break
+            if pages[-1] < max_pages:
+                await asyncio.sleep(delay_between_pages)
         
         self.logger.info(f"API采集完成，共获取{len(all_models)}个模型")
         return all_models
     
-    def _get_models_by_page(self, page: int) -> List[Dict]:
+    async def _get_models_by_page(self, page: int) -> List[Dict]:
         """获取指定页的模型数据"""
         url = f"{self.config['api_base']}/api/www/model/list"
         
@@ -234,7 +285,7 @@ class LiblibCarModelsAnalyzer:
             "nsfw": False
         }
         
-        response = self.safe_request('POST', url, json=payload)
+        response = await self.safe_request('POST', url, json=payload)
         if response:
             try:
                 data = response.json()
@@ -363,27 +414,33 @@ class LiblibCarModelsAnalyzer:
     async def collect_data_enhanced(self) -> List[Dict]:
         """增强搜索策略采集数据"""
         self.logger.info("开始增强搜索数据采集...")
-        all_models = []
+        semaphore = asyncio.Semaphore(self._concurrency())
+        
+        async def search(keyword):
+            async with semaphore:
+                models = await self._search_models_by_keyword(keyword)
+                self.logger.info(f"关键词'{keyword}'搜索到{len(models)}个模型")
+                # 每个并发槽位请求间隔1秒，避免请求过快
+                await asyncio.sleep(1)
+                return models
         
-        # 通过关键词搜索
-        for keyword in self.config['car_keywords'][:10]:  # 限制关键词数量
-            models = self._search_models_by_keyword(keyword)
-            all_models.extend(models)
-            self.logger.info(f"关键词'{keyword}'搜索到{len(models)}个模型")
-            time.sleep(1)
+        # 通过关键词并发搜索，结果按关键词顺序合并
+        keywords = self.config['car_keywords'][:10]  # 限制关键词数量
+        results = await asyncio.gather(*(search(keyword) for keyword in keywords))
         
         # 去重
         unique_models = []
         seen_ids = set()
-        for model in all_models:
-            if model.get('id') not in seen_ids:
-                unique_models.append(model)
-                seen_ids.add(model.get('id'))
+        for models in results:
+            for model in models:
+                if model.get('id') not in seen_ids:
+                    unique_models.append(model)
+                    seen_ids.add(model.get('id'))
         
         self.logger.info(f"增强搜索完成，共获取{len(unique_models)}个唯一模型")
         return unique_models
     
-    def _search_models_by_keyword(self, keyword: str) -> List[Dict]:
+    async def _search_models_by_keyword(self, keyword: str) -> List[Dict]:
         """通过关键词搜索模型"""
         url = f"{self.config['api_base']}/api/www/model/list"
         
@@ -396,7 +453,7 @@ class LiblibCarModelsAnalyzer:
             "nsfw": False
         }
         
-        response = self.safe_request('POST', url, json=payload)
+        response = await self.safe_request('POST', url, json=payload)
         if response:
             try:
                 data = response.json()
@@ -440,22 +497,23 @@ class LiblibCarModelsAnalyzer:
                     all_models.append(model)
                     seen_ids.add(model_id)
         
-        # 获取详细信息
+        # 并发获取详细信息
+        semaphore = asyncio.Semaphore(self._concurrency())
+        
+        async def fetch_detail(model):
+            async with semaphore:
+                return await self._get_model_detail(model)
+        
         detailed_models = []
-        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
-            future_to_model = {
-                executor.submit(self._get_model_detail, model): model 
-                for model in all_models[:50]  # 限制数量
-            }
-            
-            for future in as_completed(future_to_model):
-                model = future_to_model[future]
-                try:
-                    detail = future.result()
-                    if detail:
-                        detailed_models.append(detail)
-                except Exception as e:
-                    self.logger.error(f"获取模型详情失败: {e}")
+        results = await asyncio.gather(
+            *(fetch_detail(model) for model in all_models[:50]),  # 限制数量
+            return_exceptions=True
+        )
+        for detail in results:
+            if isinstance(detail, Exception):
+                self.logger.error(f"获取模型详情失败: {detail}")
+            elif detail:
+                detailed_models.append(detail)
         
         # 如果无法获取详情，但已获取基础模型列表，则回退为基础模型输出
         if not detailed_models and all_models:
@@ -465,7 +523,7 @@ class LiblibCarModelsAnalyzer:
         self.logger.info(f"综合采集完成，共获取{len(detailed_models)}个详细模型")
         return detailed_models
     
-    def _get_model_detail(self, model: Dict) -> Optional[Dict]:
+    async def _get_model_detail(self, model: Dict) -> Optional[Dict]:
         """获取模型详细信息"""
         model_id = model.get('id') or model.get('uuid')
         if not model_id:
@@ -474,7 +532,7 @@ class LiblibCarModelsAnalyzer:
         url = f"{self.config['api_base']}/api/www/model/getByUuid/{model_id}"
         params = {"timestamp": self.get_timestamp()}
         
-        response = self.safe_request('POST', url, params=params)
+        response = await self.safe_request('POST', url, params=params)
         if response:
             try:
                 data = response.json()
@@ -503,8 +561,10 @@ class LiblibCarModelsAnalyzer:
             'total': len(models)
         }
         
-        def download_single_image(model):
-            """下载单个图片"""
+        semaphore = asyncio.Semaphore(self._concurrency())
+        
+        async def download_single_image(model):
+            """下载单个图片（协程）"""
             try:
                 image_url = model.get('coverUrl') or model.get('imageUrl')
                 if not image_url:
@@ -533,11 +593,11 @@ class LiblibCarModelsAnalyzer:
                 if filepath.exists():
                     return 'skipped'
                 
-                # 下载图片
-                response = self.safe_request('GET', image_url)
+                # 下载图片，写文件放到线程池中执行，不阻塞事件循环
+                async with semaphore:
+                    response = await self.safe_request('GET', image_url)
                 if response:
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
+                    await asyncio.to_thread(filepath.write_bytes, response.content)
                     return 'success'
                 else:
                     return 'failed'
@@ -547,25 +607,19 @@ class LiblibCarModelsAnalyzer:
                 return 'failed'
         
         # 并发下载
-        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
-            future_to_model = {
-                executor.submit(download_single_image, model): model 
-                for model in models
-            }
+        for future in asyncio.as_completed([download_single_image(model) for model in models]):
+            result = await future
+            if result == 'success':
+                download_results['successful'] += 1
+            elif result == 'failed':
+                download_results['failed'] += 1
+            else:
+                download_results['skipped'] += 1
             
-            for future in as_completed(future_to_model):
-                result = future.result()
-                if result == 'success':
-                    download_results['successful'] += 1
-                elif result == 'failed':
-                    download_results['failed'] += 1
-                else:
-                    download_results['skipped'] += 1
-                
-                # 显示进度
-                total_processed = download_results['successful'] + download_results['failed'] + download_results['skipped']
-                if total_processed % 5 == 0:
-                    self.logger.info(f"下载进度: {total_processed}/{download_results['total']}")
+            # 显示进度
+            total_processed = download_results['successful'] + download_results['failed'] + download_results['skipped']
+            if total_processed % 5 == 0:
+                self.logger.info(f"下载进度: {total_processed}/{download_results['total']}")
         
         self.logger.info(f"图片下载完成: 成功{download_results['successful']}, 失败{download_results['failed']}, 跳过{download_results['skipped']}")
         return download_results
@@ -581,11 +635,11 @@ class LiblibCarModelsAnalyzer:
         # 数据预处理
         df = pd.DataFrame(models)
         
-        # 解析数值字段
+        # 解析数值字段（整列向量化解析）
         numeric_fields = ['views', 'likes', 'downloads']
         for field in numeric_fields:
             if field in df.columns:
-                df[field] = df[field].apply(self._parse_number)
+                df[field] = self._parse_number_series(df[field])
         
         # 基础统计
         basic_stats = {
@@ -669,6 +723,17 @@ class LiblibCarModelsAnalyzer:
         
         return 0
     
+    def _parse_number_series(self, series: pd.Series) -> pd.Series:
+        """整列解析数字字符串：只对去重后的取值逐个解析，再按编码整列映射回去
+        
+        浏览量、点赞数等字段重复值很多（如 '1.2k'），Python 层解析次数从行数降为不同取值数；
+        每个取值仍由 _parse_number 解析，结果（含整数/浮点类型）与逐行 apply 完全一致。
+        """
+        codes, uniques = pd.factorize(series)
+        # 缺失值的编码为 -1，对应末尾追加的 0（与 _parse_number 对缺失值的返回一致）
+        parsed = pd.Series([self._parse_number(value) for value in uniques.tolist()] + [0])
+        return pd.Series(parsed.to_numpy().take(codes), index=series.index, name=series.name)
+    
     def generate_report(self, analysis_results: Dict) -> str:
         """生成分析报告"""
         self.logger.info("开始生成分析报告...")
@@ -796,6 +861,9 @@ class LiblibCarModelsAnalyzer:
         except Exception as e:
             self.logger.error(f"分析流程执行失败: {e}")
             return False
+        
+        finally:
+            await self.aclose()
 
 def main():
     """主函数"""
@@ -16,6 +16,12 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +33,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 汽车风格关键词表：分组 -> {标签: [关键词]}
+STYLE_KEYWORDS = {
+    # 车辆类型识别
+    'vehicle_types': {
+        '跑车': ['跑车', 'sports car', 'supercar'],
+        '轿车': ['轿车', 'sedan', '轿车'],
+        'SUV': ['suv', '越野', 'off-road'],
+        '卡车': ['卡车', 'truck', '货车'],
+        '巴士': ['巴士', 'bus', '公交'],
+        '摩托车': ['摩托', 'motorcycle', '机车'],
+        '概念车': ['概念', 'concept', '未来'],
+        '赛车': ['赛车', 'racing', 'f1', 'formula'],
+        '皮卡': ['皮卡', 'pickup'],
+        '面包车': ['面包车', 'van', '商务车']
+    },
+    # 设计风格识别
+    'design_styles': {
+        '科幻': ['科幻', 'sci-fi', '未来', 'future'],
+        '复古': ['复古', 'vintage', 'retro', '经典'],
+        '现代': ['现代', 'modern', '简约'],
+        '豪华': ['豪华', 'luxury', '高端'],
+        '运动': ['运动', 'sport', '动感'],
+        '工业': ['工业', 'industrial', '机械'],
+        '极简': ['极简', 'minimal', '简洁']
+    },
+    # 渲染风格识别
+    'render_styles': {
+        '写实': ['写实', 'realistic', '真实'],
+        '插画': ['插画', 'illustration', '手绘'],
+        '3D渲染': ['3d', 'render', '渲染'],
+        '概念图': ['概念', 'concept', '草图'],
+        '技术图': ['技术', 'technical', '工程图'],
+        '海报': ['海报', 'poster', '广告']
+    },
+    # 使用场景识别
+    'use_cases': {
+        '游戏': ['游戏', 'game', '游戏设计'],
+        '广告': ['广告', 'advertising', '营销'],
+        '电影': ['电影', 'movie', '影视'],
+        '工业设计': ['工业设计', 'industrial design'],
+        '汽车设计': ['汽车设计', 'automotive design'],
+        '概念设计': ['概念设计', 'concept design']
+    }
+}
+
+def _build_style_automaton():
+    """将全部风格关键词编译为一个 Aho-Corasick 自动机"""
+    keyword_hits = {}
+    for group, labels in STYLE_KEYWORDS.items():
+        for label, keywords in labels.items():
+            for keyword in keywords:
+                keyword_hits.setdefault(keyword, set()).add((group, label))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, hits in keyword_hits.items():
+        automaton.add_word(keyword, frozenset(hits))
+    automaton.make_automaton()
+    return automaton
+
+_STYLE_AUTOMATON = _build_style_automaton() if AHOCORASICK_AVAILABLE else None
+
 class LiblibCarModelsScraper:
     def __init__(self):
         self.session = requests.Session()
@@ -251,66 +318,19 @@ class LiblibCarModelsScraper:
             'use_cases': []
         }
         
-        # 车辆类型识别
-        vehicle_keywords = {
-            '跑车': ['跑车', 'sports car', 'supercar'],
-            '轿车': ['轿车', 'sedan', '轿车'],
-            'SUV': ['suv', '越野', 'off-road'],
-            '卡车': ['卡车', 'truck', '货车'],
-            '巴士': ['巴士', 'bus', '公交'],
-            '摩托车': ['摩托', 'motorcycle', '机车'],
-            '概念车': ['概念', 'concept', '未来'],
-            '赛车': ['赛车', 'racing', 'f1', 'formula'],
-            '皮卡': ['皮卡', 'pickup'],
-            '面包车': ['面包车', 'van', '商务车']
-        }
-        
-        for vehicle_type, keywords in vehicle_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                style_analysis['vehicle_types'].append(vehicle_type)
-        
-        # 设计风格识别
-        design_keywords = {
-            '科幻': ['科幻', 'sci-fi', '未来', 'future'],
-            '复古': ['复古', 'vintage', 'retro', '经典'],
-            '现代': ['现代', 'modern', '简约'],
-            '豪华': ['豪华', 'luxury', '高端'],
-            '运动': ['运动', 'sport', '动感'],
-            '工业': ['工业', 'industrial', '机械'],
-            '极简': ['极简', 'minimal', '简洁']
-        }
-        
-        for style, keywords in design_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                style_analysis['design_styles'].append(style)
-        
-        # 渲染风格识别
-        render_keywords = {
-            '写实': ['写实', 'realistic', '真实'],
-            '插画': ['插画', 'illustration', '手绘'],
-            '3D渲染': ['3d', 'render', '渲染'],
-            '概念图': ['概念', 'concept', '草图'],
-            '技术图': ['技术', 'technical', '工程图'],
-            '海报': ['海报', 'poster', '广告']
-        }
-        
-        for style, keywords in render_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                style_analysis['render_styles'].append(style)
-        
-        # 使用场景识别
-        use_case_keywords = {
-            '游戏': ['游戏', 'game', '游戏设计'],
-            '广告': ['广告', 'advertising', '营销'],
-            '电影': ['电影', 'movie', '影视'],
-            '工业设计': ['工业设计', 'industrial design'],
-            '汽车设计': ['汽车设计', 'automotive design'],
-            '概念设计': ['概念设计', 'concept design']
-        }
-        
-        for use_case, keywords in use_case_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                style_analysis['use_cases'].append(use_case)
+        if _STYLE_AUTOMATON is not None:
+            # 单次扫描文本，一次性得到所有命中的 (分组, 标签)
+            hits = set()
+            for _, matched in _STYLE_AUTOMATON.iter(text):
+                hits |= matched
+            for group, labels in STYLE_KEYWORDS.items():
+                style_analysis[group] = [label for label in labels if (group, label) in hits]
+        else:
+            for group, labels in STYLE_KEYWORDS.items():
+                style_analysis[group] = [
+                    label for label, keywords in labels.items()
+                    if any(keyword in text for keyword in keywords)
+                ]
         
         return style_analysis
     
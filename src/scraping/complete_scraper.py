@@ -58,12 +58,13 @@ def download_image(url, filename, folder="liblib_car_models_images"):
 def parse_number(value):
     """解析数字字符串，处理k等后缀"""
     if isinstance(value, str):
-        if 'k' in value.lower():
-            return float(value.lower().replace('k', '')) * 1000
-        elif value.isdigit():
+        # 纯数字最常见，先判断可省去 lower() 的拷贝；纯数字串不可能含 k，顺序调换不影响结果
+        if value.isdigit():
             return int(value)
-        else:
-            return 0
+        lowered = value.lower()
+        if 'k' in lowered:
+            return float(lowered.replace('k', '')) * 1000
+        return 0
     return value
 
 def main():
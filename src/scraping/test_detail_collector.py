@@ -11,32 +11,81 @@ import sys
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+# API配置
+API_BASE = 'https://api2.liblib.art'
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+    'Referer': 'https://www.liblib.art/',
+    'Origin': 'https://www.liblib.art'
+}
+
+def _build_session() -> requests.Session:
+    """创建共享会话：连接池复用 TCP/TLS 连接，网关错误时自动退避重试"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    return session
+
+# 所有测试共用一个会话，避免每个接口重新建立连接
+_session = _build_session()
+
+def get_timestamp():
+    return int(time.time() * 1000)
+
+def _load_response(response: requests.Response) -> Dict[str, Any]:
+    """解析接口响应，orjson 可用时直接解析原始字节，省去文本解码与编码探测"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _save_json(file_path: str, data: Dict[str, Any]):
+    """保存接口响应，orjson 可用时直接写 UTF-8 字节
+    
+    先写临时文件再 os.replace 原子替换，中途失败不会留下半截文件。
+    """
+    tmp_path = f"{file_path}.tmp"
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, file_path)
+
 def test_api_endpoints():
     """测试API端点"""
     print("🔍 测试API端点...")
     
-    # API配置
-    api_base = 'https://api2.liblib.art'
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-        'Referer': 'https://www.liblib.art/',
-        'Origin': 'https://www.liblib.art'
-    })
-    
-    def get_timestamp():
-        return int(time.time() * 1000)
-    
     # 测试1: 搜索汽车交通模型列表（使用正确的API接口）
     print("\n📋 测试1: 搜索汽车交通模型列表")
-    search_url = f"{api_base}/api/www/model/list"
+    search_url = f"{API_BASE}/api/www/model/list"
     search_payload = {
         "categories": ["汽车交通"],  # 使用正确的参数格式
         "page": 1,
@@ -47,16 +96,15 @@ def test_api_endpoints():
     }
     
     try:
-        response = session.post(search_url, json=search_payload, timeout=30)
+        response = _session.post(search_url, json=search_payload, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _load_response(response)
             if data.get('code') == 0:
                 models = data.get('data', {}).get('list', [])
                 print(f"✅ 搜索成功，获取到 {len(models)} 个模型")
                 
                 # 保存搜索结果用于后续测试
-                with open('test_search_results.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _save_json('test_search_results.json', data)
                 
                 # 提取前3个模型ID用于详情测试
                 test_model_ids = []
@@ -82,29 +130,16 @@ def test_model_detail_api(model_id: str):
     """测试模型详情API"""
     print(f"\n🖼️ 测试模型详情API: {model_id}")
     
-    api_base = 'https://api2.liblib.art'
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-        'Referer': 'https://www.liblib.art/',
-        'Origin': 'https://www.liblib.art'
-    })
-    
-    def get_timestamp():
-        return int(time.time() * 1000)
-    
     # 测试模型详情接口
-    detail_url = f"{api_base}/api/www/model/getByUuid/{model_id}"
+    detail_url = f"{API_BASE}/api/www/model/getByUuid/{model_id}"
     detail_params = {
         "timestamp": get_timestamp()
     }
     
     try:
-        response = session.post(detail_url, params=detail_params, timeout=30)
+        response = _session.post(detail_url, params=detail_params, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _load_response(response)
             if data.get('code') == 0:
                 model_data = data.get('data', {})
                 print(f"✅ 模型详情获取成功")
@@ -115,8 +150,7 @@ def test_model_detail_api(model_id: str):
                 print(f"   下载数: {model_data.get('downloadCount', 0)}")
                 
                 # 保存详情数据
-                with open(f'test_model_detail_{model_id}.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _save_json(f'test_model_detail_{model_id}.json', data)
                 
                 return model_data
             else:
@@ -134,29 +168,16 @@ def test_author_api(model_id: str):
     """测试作者API"""
     print(f"\n👤 测试作者API: {model_id}")
     
-    api_base = 'https://api2.liblib.art'
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-        'Referer': 'https://www.liblib.art/',
-        'Origin': 'https://www.liblib.art'
-    })
-    
-    def get_timestamp():
-        return int(time.time() * 1000)
-    
     # 测试作者接口
-    author_url = f"{api_base}/api/www/model/author/{model_id}"
+    author_url = f"{API_BASE}/api/www/model/author/{model_id}"
     author_params = {
         "timestamp": get_timestamp()
     }
     
     try:
-        response = session.post(author_url, params=author_params, timeout=30)
+        response = _session.post(author_url, params=author_params, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _load_response(response)
             if data.get('code') == 0:
                 author_data = data.get('data', {})
                 print(f"✅ 作者信息获取成功")
@@ -166,8 +187,7 @@ def test_author_api(model_id: str):
                 print(f"   模型数: {author_data.get('modelCount', 0)}")
                 
                 # 保存作者数据
-                with open(f'test_author_{model_id}.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _save_json(f'test_author_{model_id}.json', data)
                 
                 return author_data
             else:
@@ -185,21 +205,8 @@ def test_comments_api(model_id: str):
     """测试评论API"""
     print(f"\n💬 测试评论API: {model_id}")
     
-    api_base = 'https://api2.liblib.art'
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-        'Referer': 'https://www.liblib.art/',
-        'Origin': 'https://www.liblib.art'
-    })
-    
-    def get_timestamp():
-        return int(time.time() * 1000)
-    
     # 测试评论接口
-    comments_url = f"{api_base}/api/www/community/commentList"
+    comments_url = f"{API_BASE}/api/www/community/commentList"
     comments_payload = {
         "modelId": model_id,
         "page": 1,
@@ -209,9 +216,9 @@ def test_comments_api(model_id: str):
     }
     
     try:
-        response = session.post(comments_url, json=comments_payload, timeout=30)
+        response = _session.post(comments_url, json=comments_payload, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = _load_response(response)
             if data.get('code') == 0:
                 comments = data.get('data', {}).get('list', [])
                 print(f"✅ 评论获取成功，共 {len(comments)} 条评论")
@@ -221,8 +228,7 @@ def test_comments_api(model_id: str):
                     print(f"   评论{i+1}: {comment.get('content', '')[:50]}...")
                 
                 # 保存评论数据
-                with open(f'test_comments_{model_id}.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _save_json(f'test_comments_{model_id}.json', data)
                 
                 return comments
             else:
@@ -236,6 +242,40 @@ def test_comments_api(model_id: str):
     
     return None
 
+def _read_structure(file_path: str):
+    """读取响应文件的结构信息，返回 (是否有 data, data 的字段, list 首项字段)
+    
+    安装了 ijson 时流式扫描，只解析到判断结构所需的位置为止，不构建完整的对象树。
+    """
+    if not IJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        if 'data' not in data:
+            return False, [], None
+        items = data['data'].get('list') if 'list' in data['data'] else None
+        return True, list(data['data'].keys()), list(items[0].keys()) if items else None
+    
+    has_data = False
+    data_keys = []
+    first_item_keys = None
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == '' and event == 'map_key' and value == 'data':
+                has_data = True
+            elif prefix == 'data' and event == 'map_key':
+                data_keys.append(value)
+            elif prefix == 'data.list.item':
+                if event == 'start_map':
+                    first_item_keys = []
+                elif event == 'map_key':
+                    first_item_keys.append(value)
+                elif event == 'end_map':
+                    break  # 首项已读完，后续内容无需解析
+            elif prefix == 'data.list' and event == 'end_array':
+                break
+    return has_data, data_keys, first_item_keys
+
 def analyze_api_structure():
     """分析API响应结构"""
     print("\n🔍 分析API响应结构...")
@@ -255,19 +295,17 @@ def analyze_api_structure():
             if os.path.exists(file_path):
                 print(f"\n📄 分析文件: {file_path}")
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    has_data, data_keys, first_item_keys = _read_structure(file_path)
                     
                     # 分析数据结构
-                    if 'data' in data:
-                        if 'list' in data['data']:
+                    if has_data:
+                        if 'list' in data_keys:
                             print("   📋 列表结构 (list)")
-                            if data['data']['list']:
-                                first_item = data['data']['list'][0]
-                                print(f"   示例字段: {list(first_item.keys())}")
+                            if first_item_keys is not None:
+                                print(f"   示例字段: {first_item_keys}")
                         else:
                             print("   📄 详情结构 (single item)")
-                            print(f"   字段: {list(data['data'].keys())}")
+                            print(f"   字段: {data_keys}")
                 except Exception as e:
                     print(f"   ❌ 文件读取失败: {e}")
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+配置管理器单元测试 - 扁平派生键
+"""
+
+import os
+import sys
+import json
+import tempfile
+import shutil
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from config_manager import ConfigManager
+
+
+class TestDerivedKeys(unittest.TestCase):
+    """扁平派生键测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, 'config.json')
+        # 屏蔽外部 LIBLIB_ 环境变量
+        self.env = {k: v for k, v in os.environ.items() if not k.startswith('LIBLIB_')}
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir)
+
+    def _load(self, file_config=None, env=None):
+        if file_config is not None:
+            with open(self.config_path, 'w', encoding='utf-8') as f:
+                json.dump(file_config, f)
+        path = self.config_path if file_config is not None else os.path.join(self.temp_dir, 'missing.json')
+        with patch.dict(os.environ, {**self.env, **(env or {})}, clear=True):
+            return ConfigManager().load_config(path)
+
+    def test_defaults(self):
+        """测试默认配置的派生键"""
+        config = self._load()
+        self.assertEqual(config['api_base'], 'https://api2.liblib.art')
+        self.assertEqual(config['base_url'], 'https://www.liblib.art')
+        self.assertEqual(config['page_size'], 48)
+        self.assertEqual(config['max_workers'], 4)
+        self.assertEqual(config['car_keywords'], config['tags']['enabled'])
+
+    def test_file_overrides_nested_values(self):
+        """测试配置文件覆盖嵌套值后派生键同步"""
+        config = self._load({
+            'api': {'base_url': 'https://api.example.com'},
+            'scraping': {'page_size': 12, 'max_workers': 2},
+            'tags': {'enabled': ['跑车']}
+        })
+        self.assertEqual(config['api_base'], 'https://api.example.com')
+        self.assertEqual(config['page_size'], 12)
+        self.assertEqual(config['max_workers'], 2)
+        self.assertEqual(config['car_keywords'], ['跑车'])
+
+    def test_explicit_flat_keys_win(self):
+        """测试配置文件中显式的扁平键优先"""
+        config = self._load({'page_size': 10, 'car_keywords': ['卡车']})
+        self.assertEqual(config['page_size'], 10)
+        self.assertEqual(config['car_keywords'], ['卡车'])
+
+    def test_environment_overrides(self):
+        """测试环境变量覆盖后派生键同步"""
+        config = self._load(env={
+            'LIBLIB_API_BASE_URL': 'https://env.example.com',
+            'LIBLIB_MAX_WORKERS': '9'
+        })
+        self.assertEqual(config['api']['base_url'], 'https://env.example.com')
+        self.assertEqual(config['api_base'], 'https://env.example.com')
+        self.assertEqual(config['scraping']['max_workers'], 9)
+        self.assertEqual(config['max_workers'], 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
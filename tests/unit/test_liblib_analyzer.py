@@ -194,7 +194,7 @@ class TestLiblibCarAnalyzer(unittest.TestCase):
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_request.return_value = mock_response
             
-            models = self.analyzer._get_models_by_page(1)
+            models = asyncio.run(self.analyzer._get_models_by_page(1))
             self.assertEqual(models, [])
         
         # 测试文件操作错误